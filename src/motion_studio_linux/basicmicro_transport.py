@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
+from functools import partial
 from typing import Any, Callable
 
 from motion_studio_linux.errors import (
@@ -27,6 +29,18 @@ except ModuleNotFoundError:  # pragma: no cover - exercised when dependency is a
     _BASICMICRO_AVAILABLE = False
 
 
+# field -> (controller read, index of the value in its response tuple, failure message)
+_TELEMETRY_SOURCES: dict[str, tuple[str, int, str]] = {
+    "battery_voltage": ("ReadMainBatteryVoltage", 1, "Failed to read main battery voltage."),
+    "logic_battery_voltage": ("ReadLogicBatteryVoltage", 1, "Failed to read logic battery voltage."),
+    "motor1_current": ("ReadCurrents", 1, "Failed to read current telemetry."),
+    "motor2_current": ("ReadCurrents", 2, "Failed to read current telemetry."),
+    "encoder1": ("ReadEncM1", 1, "Failed to read encoder1."),
+    "encoder2": ("ReadEncM2", 1, "Failed to read encoder2."),
+    "error_bits": ("ReadError", 1, "Failed to read error bits."),
+}
+
+
 class BasicmicroTransport:
     """Implements controller operations using Basicmicro packet serial APIs."""
 
@@ -129,7 +143,7 @@ class BasicmicroTransport:
             payload["max_current"] = m1_max
         return payload
 
-    def apply_config(self, parameters: dict[str, Any]) -> None:
+    def apply_config(self, parameters: Mapping[str, Any]) -> None:
         unknown_keys = set(parameters) - {
             "config",
             "mode",
@@ -225,69 +239,21 @@ class BasicmicroTransport:
     def read_telemetry(self, fields: tuple[str, ...]) -> dict[str, Any]:
         controller, address = self._require_connected()
         telemetry: dict[str, Any] = {}
-        currents_cache: tuple[int, int] | None = None
+        # Each controller read is a serial round-trip; fields sharing one (e.g. both currents) reuse it.
+        responses: dict[str, tuple[Any, ...]] = {}
 
         for field in fields:
-            if field == "battery_voltage":
-                ok, value = self._invoke(
-                    "ReadMainBatteryVoltage",
-                    lambda: controller.ReadMainBatteryVoltage(address),
-                )
-                if not ok:
-                    raise CrcErrorResponse(
-                        "Failed to read main battery voltage.",
-                        details=self._context("ReadMainBatteryVoltage"),
-                    )
-                telemetry[field] = value
-                continue
-
-            if field == "logic_battery_voltage":
-                ok, value = self._invoke(
-                    "ReadLogicBatteryVoltage",
-                    lambda: controller.ReadLogicBatteryVoltage(address),
-                )
-                if not ok:
-                    raise CrcErrorResponse(
-                        "Failed to read logic battery voltage.",
-                        details=self._context("ReadLogicBatteryVoltage"),
-                    )
-                telemetry[field] = value
-                continue
-
-            if field in {"motor1_current", "motor2_current"}:
-                if currents_cache is None:
-                    ok, m1, m2 = self._invoke("ReadCurrents", lambda: controller.ReadCurrents(address))
-                    if not ok:
-                        raise CrcErrorResponse(
-                            "Failed to read current telemetry.",
-                            details=self._context("ReadCurrents"),
-                        )
-                    currents_cache = (m1, m2)
-                telemetry[field] = currents_cache[0] if field == "motor1_current" else currents_cache[1]
-                continue
-
-            if field == "encoder1":
-                ok, enc, _status = self._invoke("ReadEncM1", lambda: controller.ReadEncM1(address))
-                if not ok:
-                    raise CrcErrorResponse("Failed to read encoder1.", details=self._context("ReadEncM1"))
-                telemetry[field] = enc
-                continue
-
-            if field == "encoder2":
-                ok, enc, _status = self._invoke("ReadEncM2", lambda: controller.ReadEncM2(address))
-                if not ok:
-                    raise CrcErrorResponse("Failed to read encoder2.", details=self._context("ReadEncM2"))
-                telemetry[field] = enc
-                continue
-
-            if field == "error_bits":
-                ok, value = self._invoke("ReadError", lambda: controller.ReadError(address))
-                if not ok:
-                    raise CrcErrorResponse("Failed to read error bits.", details=self._context("ReadError"))
-                telemetry[field] = value
-                continue
-
-            raise ValueError(f"Unsupported telemetry field: {field}")
+            source = _TELEMETRY_SOURCES.get(field)
+            if source is None:
+                raise ValueError(f"Unsupported telemetry field: {field}")
+            operation, index, failure_message = source
+            response = responses.get(operation)
+            if response is None:
+                response = self._invoke(operation, partial(getattr(controller, operation), address))
+                if not response[0]:
+                    raise CrcErrorResponse(failure_message, details=self._context(operation))
+                responses[operation] = response
+            telemetry[field] = response[index]
 
         return telemetry
 
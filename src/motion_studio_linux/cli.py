@@ -5,7 +5,9 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -16,13 +18,36 @@ from motion_studio_linux.errors import MotionStudioError
 from motion_studio_linux.flasher import Flasher
 from motion_studio_linux.models import ConfigPayload, DEFAULT_ADDRESS, utc_timestamp
 from motion_studio_linux.recipes import resolve_recipe
-from motion_studio_linux.reporting import artifact_path, write_csv_report, write_json_report
+from motion_studio_linux.reporting import FileReportSink, ReportSink, artifact_path
 from motion_studio_linux.session import RoboClawSession
 from motion_studio_linux.telemetry import Telemetry
 from motion_studio_linux.tester import Tester
 
 SessionFactory = Callable[[int], RoboClawSession]
 
+# json.dumps(..., sort_keys=True) builds a new JSONEncoder per call; bind one once instead.
+_encode_json_line = json.JSONEncoder(sort_keys=True).encode
+
+
+@dataclass(frozen=True, slots=True)
+class CliResult:
+    """Outcome of one CLI command before it is rendered to stdout/stderr."""
+
+    exit_code: int
+    output: Mapping[str, Any] | None = None
+    error: Mapping[str, Any] | None = None
+    # Pre-rendered stdout for commands whose console form is not the JSON ``output``.
+    text: str | None = None
+
+
+def _invalid_input(exc: ValueError) -> dict[str, Any]:
+    return {"code": "invalid_input", "details": {}, "message": str(exc)}
+
+
+def _with_report(error: dict[str, Any], report_file: Path) -> dict[str, Any]:
+    # Point callers at the error artifact the same way verification failures do.
+    return {**error, "details": {**error["details"], "report": str(report_file)}}
+
 
 def _parse_address(raw_value: str) -> int:
     value = int(raw_value, 0)
@@ -31,6 +56,8 @@ def _parse_address(raw_value: str) -> int:
     return value
 
 
+# The parser tree is invariant, and parse_args() leaves it untouched, so build it once per process.
+@lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="roboclaw",
@@ -111,20 +138,16 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _run_list(args: argparse.Namespace, device_manager: DeviceManager) -> int:
-    del args
+def _run_list(_args: argparse.Namespace, device_manager: DeviceManager) -> CliResult:
     ports = sorted(device_manager.list_ports())
-    if not ports:
-        return 0
-    print("\n".join(ports))
-    return 0
+    return CliResult(0, output={"ports": ports}, text="".join(f"{port}\n" for port in ports))
 
 
 def _run_info(
     args: argparse.Namespace,
     _device_manager: DeviceManager,
     session_factory: SessionFactory,
-) -> int:
+) -> CliResult:
     session = session_factory(args.address)
     try:
         session.connect(args.port)
@@ -137,15 +160,14 @@ def _run_info(
         "firmware": firmware,
         "port": args.port,
     }
-    print(json.dumps(payload, sort_keys=True))
-    return 0
+    return CliResult(0, output=payload)
 
 
 def _run_dump(
     args: argparse.Namespace,
     _device_manager: DeviceManager,
     session_factory: SessionFactory,
-) -> int:
+) -> CliResult:
     session = session_factory(args.address)
     try:
         session.connect(args.port)
@@ -162,18 +184,15 @@ def _run_dump(
         firmware=firmware,
         payload=config,
     )
-    return 0
-
-
-def _write_error_report(path: Path, payload: dict[str, Any]) -> None:
-    write_json_report(path, payload)
+    return CliResult(0)
 
 
 def _run_flash(
     args: argparse.Namespace,
     _device_manager: DeviceManager,
     session_factory: SessionFactory,
-) -> int:
+    report_sink: ReportSink,
+) -> CliResult:
     report_dir = Path(args.report_dir)
     session = session_factory(args.address)
     config: ConfigPayload | None = None
@@ -196,35 +215,29 @@ def _run_flash(
             address=args.address,
             timestamp=flash_report.timestamp,
         )
-        write_json_report(report_file, flash_report)
-        print(json.dumps({"report": str(report_file)}, sort_keys=True))
+        report_sink.write_json(report_file, flash_report)
+        output = {"report": str(report_file)}
         if flash_report.verification_result == "mismatch":
-            print(
-                json.dumps(
-                    {
-                        "code": "verification_mismatch",
-                        "details": {"report": str(report_file)},
-                        "message": "Config readback does not match requested values.",
-                    },
-                    sort_keys=True,
-                ),
-                file=sys.stderr,
+            return CliResult(
+                15,
+                output=output,
+                error={
+                    "code": "verification_mismatch",
+                    "details": {"report": str(report_file)},
+                    "message": "Config readback does not match requested values.",
+                },
             )
-            return 15
         if flash_report.verification_result == "error":
-            print(
-                json.dumps(
-                    {
-                        "code": "verification_failed",
-                        "details": {"report": str(report_file)},
-                        "message": "Config readback verification failed after retry.",
-                    },
-                    sort_keys=True,
-                ),
-                file=sys.stderr,
+            return CliResult(
+                16,
+                output=output,
+                error={
+                    "code": "verification_failed",
+                    "details": {"report": str(report_file)},
+                    "message": "Config readback verification failed after retry.",
+                },
             )
-            return 16
-        return 0
+        return CliResult(0, output=output)
     except MotionStudioError as exc:
         failure_timestamp = utc_timestamp()
         report_file = artifact_path(
@@ -234,7 +247,7 @@ def _run_flash(
             address=args.address,
             timestamp=failure_timestamp,
         )
-        _write_error_report(
+        report_sink.write_json(
             report_file,
             {
                 "timestamp": failure_timestamp,
@@ -250,8 +263,7 @@ def _run_flash(
                 "error": exc.to_dict(),
             },
         )
-        print(json.dumps(exc.to_dict(), sort_keys=True), file=sys.stderr)
-        return exc.exit_code
+        return CliResult(exc.exit_code, error=_with_report(exc.to_dict(), report_file))
     except ValueError as exc:
         failure_timestamp = utc_timestamp()
         report_file = artifact_path(
@@ -261,7 +273,7 @@ def _run_flash(
             address=args.address,
             timestamp=failure_timestamp,
         )
-        _write_error_report(
+        report_sink.write_json(
             report_file,
             {
                 "timestamp": failure_timestamp,
@@ -277,11 +289,7 @@ def _run_flash(
                 "error": {"code": "invalid_input", "message": str(exc), "details": {}},
             },
         )
-        print(
-            json.dumps({"code": "invalid_input", "details": {}, "message": str(exc)}, sort_keys=True),
-            file=sys.stderr,
-        )
-        return 2
+        return CliResult(2, error=_with_report(_invalid_input(exc), report_file))
     finally:
         session.disconnect()
 
@@ -290,7 +298,8 @@ def _run_test(
     args: argparse.Namespace,
     _device_manager: DeviceManager,
     session_factory: SessionFactory,
-) -> int:
+    report_sink: ReportSink,
+) -> CliResult:
     report_dir = Path(args.report_dir)
     recipe = None
     session = session_factory(args.address)
@@ -308,7 +317,7 @@ def _run_test(
             address=args.address,
             timestamp=test_report.timestamp,
         )
-        write_json_report(report_file, test_report)
+        report_sink.write_json(report_file, test_report)
         if args.csv:
             csv_file = artifact_path(
                 report_dir=report_dir,
@@ -318,9 +327,8 @@ def _run_test(
                 timestamp=test_report.timestamp,
                 extension="csv",
             )
-            write_csv_report(csv_file, [test_report.telemetry_summary])
-        print(json.dumps({"report": str(report_file)}, sort_keys=True))
-        return 0 if test_report.passed else 14
+            report_sink.write_csv(csv_file, [test_report.telemetry_summary])
+        return CliResult(0 if test_report.passed else 14, output={"report": str(report_file)})
     except ValueError as exc:
         failure_timestamp = utc_timestamp()
         report_file = artifact_path(
@@ -330,7 +338,7 @@ def _run_test(
             address=args.address,
             timestamp=failure_timestamp,
         )
-        _write_error_report(
+        report_sink.write_json(
             report_file,
             {
                 "timestamp": failure_timestamp,
@@ -344,11 +352,7 @@ def _run_test(
                 "error": {"code": "invalid_input", "message": str(exc), "details": {}},
             },
         )
-        print(
-            json.dumps({"code": "invalid_input", "details": {}, "message": str(exc)}, sort_keys=True),
-            file=sys.stderr,
-        )
-        return 2
+        return CliResult(2, error=_with_report(_invalid_input(exc), report_file))
     except MotionStudioError as exc:
         failure_timestamp = utc_timestamp()
         report_file = artifact_path(
@@ -360,7 +364,7 @@ def _run_test(
         )
         recipe_id = recipe.recipe_id if recipe is not None else args.recipe
         safety_limits = recipe.safety_limits if recipe is not None else {}
-        _write_error_report(
+        report_sink.write_json(
             report_file,
             {
                 "timestamp": failure_timestamp,
@@ -374,22 +378,24 @@ def _run_test(
                 "error": exc.to_dict(),
             },
         )
-        print(json.dumps(exc.to_dict(), sort_keys=True), file=sys.stderr)
-        return exc.exit_code
+        return CliResult(exc.exit_code, error=_with_report(exc.to_dict(), report_file))
     finally:
         session.disconnect()
 
 
-def main(
+def run(
     argv: Sequence[str] | None = None,
     *,
     device_manager: DeviceManager | None = None,
     session_factory: SessionFactory | None = None,
-) -> int:
+    report_sink: ReportSink | None = None,
+) -> CliResult:
+    """Execute one CLI command and return its structured result without printing it."""
     parser = _build_parser()
     args = parser.parse_args(argv)
 
     manager = device_manager or DeviceManager()
+    sink = report_sink or FileReportSink()
     session_builder = session_factory or (
         lambda address: RoboClawSession(
             transport=build_basicmicro_transport_from_env(),
@@ -406,19 +412,36 @@ def main(
         if handler is _run_dump:
             return _run_dump(args, manager, session_builder)
         if handler is _run_flash:
-            return _run_flash(args, manager, session_builder)
+            return _run_flash(args, manager, session_builder, sink)
         if handler is _run_test:
-            return _run_test(args, manager, session_builder)
+            return _run_test(args, manager, session_builder, sink)
         raise ValueError(f"Unsupported command handler: {handler!r}")
     except MotionStudioError as exc:
-        print(json.dumps(exc.to_dict(), sort_keys=True), file=sys.stderr)
-        return exc.exit_code
+        return CliResult(exc.exit_code, error=exc.to_dict())
     except ValueError as exc:
-        print(
-            json.dumps({"code": "invalid_input", "details": {}, "message": str(exc)}, sort_keys=True),
-            file=sys.stderr,
-        )
-        return 2
+        return CliResult(2, error=_invalid_input(exc))
+
+
+def main(
+    argv: Sequence[str] | None = None,
+    *,
+    device_manager: DeviceManager | None = None,
+    session_factory: SessionFactory | None = None,
+    report_sink: ReportSink | None = None,
+) -> int:
+    result = run(
+        argv,
+        device_manager=device_manager,
+        session_factory=session_factory,
+        report_sink=report_sink,
+    )
+    if result.text is not None:
+        sys.stdout.write(result.text)
+    elif result.output is not None:
+        print(_encode_json_line(result.output))
+    if result.error is not None:
+        print(_encode_json_line(result.error), file=sys.stderr)
+    return result.exit_code
 
 
 if __name__ == "__main__":
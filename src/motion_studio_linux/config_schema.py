@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from motion_studio_linux.models import ConfigPayload
+from motion_studio_linux.reporting import encode_json
 
 CONFIG_SCHEMA_VERSION = "v1"
 
@@ -44,11 +45,8 @@ def write_dump_file(
         "address": f"0x{target_address:02X}",
         "config_hash": payload.config_hash,
         "firmware": firmware,
-        "parameters": payload.parameters,
+        "parameters": dict(payload.parameters),
         "port": target_port,
         "schema_version": payload.schema_version,
     }
-    out_path.write_text(
-        json.dumps(dump_payload, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    out_path.write_bytes(encode_json(dump_payload) + b"\n")
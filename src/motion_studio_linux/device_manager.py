@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
-from glob import glob
+import os
+from collections.abc import Callable, Iterable, Iterator
+
+DEV_DIR = "/dev"
+PORT_PREFIXES: tuple[str, ...] = ("ttyACM", "ttyUSB")
+
+
+def iter_candidates() -> Iterator[str]:
+    """Yield ``/dev`` entries whose names start with a known RoboClaw port prefix."""
+    try:
+        with os.scandir(DEV_DIR) as entries:
+            for entry in entries:
+                if entry.name.startswith(PORT_PREFIXES):
+                    yield f"{DEV_DIR}/{entry.name}"
+    except OSError:
+        # Like the glob scan this replaced: a missing, unreadable or non-directory /dev means no ports.
+        return
 
 
 class DeviceManager:
     """Find candidate RoboClaw serial devices on Linux."""
 
-    PORT_PATTERNS: tuple[str, ...] = ("/dev/ttyACM*", "/dev/ttyUSB*")
+    def __init__(self, *, iter_candidates: Callable[[], Iterable[str]] = iter_candidates) -> None:
+        self._iter_candidates = iter_candidates
 
     def list_ports(self) -> list[str]:
-        ports: set[str] = set()
-        for pattern in self.PORT_PATTERNS:
-            ports.update(glob(pattern))
-        return sorted(ports)
+        return sorted(set(self._iter_candidates()))
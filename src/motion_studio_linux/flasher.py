@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Mapping
 
 from motion_studio_linux.errors import MotionStudioError
 from motion_studio_linux.models import ConfigPayload, FlashReport, utc_timestamp
@@ -25,7 +26,7 @@ class Flasher:
         self._session.reload_from_nvm()
 
     @staticmethod
-    def _is_subset_match(*, readback: dict[str, object], requested: dict[str, object]) -> bool:
+    def _is_subset_match(*, readback: Mapping[str, object], requested: Mapping[str, object]) -> bool:
         return all(readback.get(key) == value for key, value in requested.items())
 
     def _verify_readback(self, config: ConfigPayload) -> str:
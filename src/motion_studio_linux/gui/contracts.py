@@ -8,8 +8,8 @@ from typing import Protocol
 class GuiBackendFacade(Protocol):
     """Minimal backend operations the GUI needs to orchestrate MVP workflows."""
 
-    def list_devices(self) -> list[str]:
-        """Return available serial device paths."""
+    def list_devices(self, *, bypass_cache: bool = False) -> list[str]:
+        """Return available serial device paths; ``bypass_cache`` forces a fresh scan."""
 
     def get_device_info(self, *, port: str, address: int) -> dict[str, object]:
         """Return firmware/device identity payload."""
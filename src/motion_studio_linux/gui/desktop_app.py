@@ -89,7 +89,7 @@ class MotionStudioDesktopShell:
         ttk.Label(header, text="Port").grid(row=0, column=0, padx=(0, 6))
         self.port_combo = ttk.Combobox(header, textvariable=self.port_var, state="readonly", width=28)
         self.port_combo.grid(row=0, column=1, padx=(0, 12))
-        ttk.Button(header, text="Refresh Ports", command=self._refresh_ports).grid(row=0, column=2, padx=(0, 12))
+        ttk.Button(header, text="Refresh Ports", command=self._on_refresh_ports).grid(row=0, column=2, padx=(0, 12))
 
         ttk.Label(header, text="Address").grid(row=0, column=3, padx=(0, 6))
         ttk.Entry(header, textvariable=self.address_var, width=10).grid(row=0, column=4, padx=(0, 12))
@@ -472,8 +472,11 @@ class MotionStudioDesktopShell:
         self.live_enc2_var.set(_format_raw(telemetry.get("encoder2")))
         self.live_error_bits_var.set(_format_error_bits(telemetry.get("error_bits")))
 
-    def _refresh_ports(self) -> None:
-        ports = self.controller.refresh_ports()
+    def _on_refresh_ports(self) -> None:
+        self._refresh_ports(rescan=True)
+
+    def _refresh_ports(self, *, rescan: bool = False) -> None:
+        ports = self.controller.refresh_ports(rescan=rescan)
         self.port_combo["values"] = ports
         if ports:
             if self.port_var.get() not in ports:
@@ -728,7 +731,7 @@ class MotionStudioDesktopShell:
 
         normalized = json.dumps(payload, indent=2, sort_keys=True) + "\n"
         try:
-            Path(path).write_text(normalized, encoding="utf-8")
+            Path(path).write_bytes(normalized.encode("utf-8"))
         except OSError as exc:
             messagebox.showerror("Save Failed", str(exc))
             return False
@@ -753,7 +756,7 @@ class MotionStudioDesktopShell:
         self._on_flash()
 
     def _refresh_reports(self) -> None:
-        report_dir = Path(self.reports_dir_var.get().strip() or "reports")
+        report_dir = self.reports_dir_var.get().strip() or "reports"
         files = self.controller.list_reports(report_dir=report_dir)
         self.report_list.delete(0, "end")
         for file in files:
@@ -806,16 +809,15 @@ class MotionStudioDesktopShell:
 
 
 def _format_raw(value: object) -> str:
-    if value is None:
-        return "-"
-    return str(value)
+    return "-" if value is None else str(value)
 
 
 def _format_deci_volts(value: object) -> str:
     if value is None:
         return "-"
     if isinstance(value, (int, float)):
-        return f"{float(value) / 10.0:.1f} V ({value})"
+        # True division already yields a float; no float() round-trip needed.
+        return f"{value / 10:.1f} V ({value})"
     return str(value)
 
 
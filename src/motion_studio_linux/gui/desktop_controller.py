@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import os
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Any
 
@@ -19,16 +20,27 @@ from motion_studio_linux.gui.reducer import (
 from motion_studio_linux.gui.state import AppState
 from motion_studio_linux.gui.viewmodels import summarize_error, summarize_flash_result, summarize_test_result
 
+_SUCCESS_SUMMARIES: dict[str, Callable[[Mapping[str, Any]], str]] = {
+    "flash": summarize_flash_result,
+    "test": summarize_test_result,
+    "status": lambda _payload: "Status refresh completed",
+    "pwm_pulse": lambda _payload: "PWM pulse completed",
+    "stop_all": lambda _payload: "Stop All completed",
+}
+
 
 class DesktopShellController:
     """Pure controller helpers for desktop shell orchestration and state transitions."""
 
+    __slots__ = ("_facade", "state")
+
     def __init__(self, facade: GuiBackendFacade) -> None:
         self._facade = facade
         self.state = AppState()
 
-    def refresh_ports(self) -> tuple[str, ...]:
-        ports = tuple(self._facade.list_devices())
+    def refresh_ports(self, *, rescan: bool = False) -> tuple[str, ...]:
+        # An explicit user refresh passes rescan=True so a just-plugged controller shows up at once.
+        ports = tuple(self._facade.list_devices(bypass_cache=rescan))
         self.state = reduce_state(self.state, PortsDiscovered(ports=ports))
         return ports
 
@@ -49,7 +61,8 @@ class DesktopShellController:
         report_path = str(report_value) if report_value is not None else None
 
         if bool(payload.get("ok")):
-            message = self._summarize_success(command=command, payload=payload)
+            summarize = _SUCCESS_SUMMARIES.get(command)
+            message = summarize(payload) if summarize is not None else f"{command} completed"
             self.state = reduce_state(self.state, JobSucceeded(message=message, report_path=report_path))
             return message
 
@@ -127,26 +140,12 @@ class DesktopShellController:
     def run_stop_all(self, *, port: str, address: int) -> dict[str, Any]:
         return _coerce_payload(self._facade.stop_all(port=port, address=address))
 
-    def list_reports(self, *, report_dir: Path) -> list[Path]:
+    def list_reports(self, *, report_dir: str | os.PathLike[str]) -> list[Path]:
         return list_report_files(report_dir)
 
     def read_report_preview(self, *, path: Path, max_chars: int = 20000) -> str:
         return read_preview_text(path, max_chars=max_chars)
 
-    @staticmethod
-    def _summarize_success(*, command: str, payload: Mapping[str, Any]) -> str:
-        if command == "flash":
-            return summarize_flash_result(dict(payload))
-        if command == "test":
-            return summarize_test_result(dict(payload))
-        if command == "status":
-            return "Status refresh completed"
-        if command == "pwm_pulse":
-            return "PWM pulse completed"
-        if command == "stop_all":
-            return "Stop All completed"
-        return f"{command} completed"
-
 
 def _coerce_payload(payload: object) -> dict[str, Any]:
     if isinstance(payload, dict):
@@ -2,27 +2,51 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 
 def parse_address(raw: str) -> int:
+    return _parse_address_cached(raw.strip())
+
+
+@lru_cache(maxsize=64)
+def _parse_address_cached(raw: str) -> int:
+    # The address box is re-read on every action; repeated values skip int() parsing entirely.
     value = int(raw, 0)
-    if not (0 <= value <= 0xFF):
+    if not 0 <= value <= 0xFF:
         raise ValueError("Address must be in range 0x00..0xFF.")
     return value
 
 
-def list_report_files(report_dir: Path) -> list[Path]:
-    if not report_dir.exists():
+def list_report_files(report_dir: str | os.PathLike[str]) -> list[Path]:
+    # scandir answers is_file() from the directory read itself; only regular files pay for a stat().
+    # Sort plain strings and build each Path once, at the return boundary.
+    entries: list[tuple[float, str, str]] = []
+    try:
+        it = os.scandir(os.fspath(report_dir))
+    except FileNotFoundError:
         return []
-    files = [p for p in report_dir.iterdir() if p.is_file()]
-    return sorted(files, key=lambda p: p.stat().st_mtime, reverse=True)
+    with it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:
+                # Deleted or rotated after the directory read; list the remaining reports.
+                continue
+            entries.append((mtime, entry.name, entry.path))
+    entries.sort(reverse=True)
+    return [Path(path) for _mtime, _name, path in entries]
 
 
 def read_preview_text(path: Path, *, max_chars: int = 20000) -> str:
-    if not path.exists():
-        raise FileNotFoundError(path)
-    data = path.read_text(encoding="utf-8", errors="replace")
-    if len(data) <= max_chars:
-        return data
-    return data[:max_chars] + "\n...\n[truncated]"
+    # Read at most one character past the limit instead of loading the whole file to slice it.
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        head = handle.read(max_chars)
+        truncated = bool(handle.read(1))
+    if not truncated:
+        return head
+    return head + "\n...\n[truncated]"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
@@ -28,6 +29,14 @@ STATUS_FIELDS = (
     "encoder2",
     "error_bits",
 )
+# Port scans hit the filesystem; GUI refresh/poll bursts within this window reuse the last scan.
+DEFAULT_PORTS_TTL_S = 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class _PortsCache:
+    timestamp: float
+    ports: tuple[str, ...]
 
 
 class ServiceGuiFacade:
@@ -38,8 +47,11 @@ class ServiceGuiFacade:
         *,
         device_manager: DeviceManager | None = None,
         session_factory: SessionFactory | None = None,
+        ports_ttl_s: float = DEFAULT_PORTS_TTL_S,
     ) -> None:
         self._device_manager = device_manager or DeviceManager()
+        self._ports_ttl_s = ports_ttl_s
+        self._ports_cache: _PortsCache | None = None
         self._session_factory = session_factory or (
             lambda address: RoboClawSession(
                 transport=build_basicmicro_transport_from_env(),
@@ -47,8 +59,14 @@ class ServiceGuiFacade:
             )
         )
 
-    def list_devices(self) -> list[str]:
-        return sorted(self._device_manager.list_ports())
+    def list_devices(self, *, bypass_cache: bool = False) -> list[str]:
+        now = time.monotonic()
+        cache = self._ports_cache
+        if bypass_cache or cache is None or now - cache.timestamp >= self._ports_ttl_s:
+            # Sort once on refresh; cache hits only copy the stored tuple.
+            cache = _PortsCache(timestamp=now, ports=tuple(sorted(self._device_manager.list_ports())))
+            self._ports_cache = cache
+        return list(cache.ports)
 
     def get_device_info(self, *, port: str, address: int) -> dict[str, object]:
         session = self._session_factory(address)
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import argparse
 import json
-from collections.abc import Sequence
+import sys
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from motion_studio_linux.gui.facade import ServiceGuiFacade
 from motion_studio_linux.gui.reducer import (
@@ -19,182 +23,275 @@ from motion_studio_linux.gui.state import AppState
 from motion_studio_linux.gui.viewmodels import summarize_error, summarize_flash_result, summarize_test_result
 
 
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="roboclaw-gui-mock")
-    subparsers = parser.add_subparsers(dest="command", required=True)
+if TYPE_CHECKING:
+    _SubParsers = argparse._SubParsersAction[argparse.ArgumentParser]
+
+
+def _add_target_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--port", required=True)
+    parser.add_argument("--address", default="0x80")
 
+
+def _build_list(subparsers: _SubParsers) -> None:
     subparsers.add_parser("list", help="Mock GUI: list devices.")
 
+
+def _build_info(subparsers: _SubParsers) -> None:
     info = subparsers.add_parser("info", help="Mock GUI: query device info.")
-    info.add_argument("--port", required=True)
-    info.add_argument("--address", default="0x80")
+    _add_target_arguments(info)
+
 
+def _build_status(subparsers: _SubParsers) -> None:
     status = subparsers.add_parser("status", help="Mock GUI: read live status telemetry.")
-    status.add_argument("--port", required=True)
-    status.add_argument("--address", default="0x80")
+    _add_target_arguments(status)
 
+
+def _build_dump(subparsers: _SubParsers) -> None:
     dump = subparsers.add_parser("dump", help="Mock GUI: dump config.")
-    dump.add_argument("--port", required=True)
-    dump.add_argument("--address", default="0x80")
+    _add_target_arguments(dump)
     dump.add_argument("--out", required=True)
 
+
+def _build_flash(subparsers: _SubParsers) -> None:
     flash = subparsers.add_parser("flash", help="Mock GUI: flash config.")
-    flash.add_argument("--port", required=True)
-    flash.add_argument("--address", default="0x80")
+    _add_target_arguments(flash)
     flash.add_argument("--config", required=True)
     flash.add_argument("--verify", action="store_true")
     flash.add_argument("--report-dir", default="reports")
 
+
+def _build_test(subparsers: _SubParsers) -> None:
     test = subparsers.add_parser("test", help="Mock GUI: run test recipe.")
-    test.add_argument("--port", required=True)
-    test.add_argument("--address", default="0x80")
+    _add_target_arguments(test)
     test.add_argument("--recipe", required=True)
     test.add_argument("--report-dir", default="reports")
     test.add_argument("--csv", action="store_true")
 
+
+def _build_pwm(subparsers: _SubParsers) -> None:
     pwm = subparsers.add_parser("pwm", help="Mock GUI: run bounded pwm pulse.")
-    pwm.add_argument("--port", required=True)
-    pwm.add_argument("--address", default="0x80")
+    _add_target_arguments(pwm)
     pwm.add_argument("--duty-m1", type=int, default=0)
     pwm.add_argument("--duty-m2", type=int, default=0)
     pwm.add_argument("--runtime-s", type=float, default=0.5)
 
+
+def _build_stop(subparsers: _SubParsers) -> None:
     stop = subparsers.add_parser("stop", help="Mock GUI: stop all motors.")
-    stop.add_argument("--port", required=True)
-    stop.add_argument("--address", default="0x80")
+    _add_target_arguments(stop)
+
+
+_SUBCOMMAND_BUILDERS: dict[str, Callable[[_SubParsers], None]] = {
+    "list": _build_list,
+    "info": _build_info,
+    "status": _build_status,
+    "dump": _build_dump,
+    "flash": _build_flash,
+    "test": _build_test,
+    "pwm": _build_pwm,
+    "stop": _build_stop,
+}
 
+
+def _selected_command(argv: Sequence[str]) -> str | None:
+    if not argv or argv[0] not in _SUBCOMMAND_BUILDERS:
+        return None
+    return argv[0]
+
+
+# One parser per known command (plus the full tree); parse_args() leaves them untouched.
+@lru_cache(maxsize=len(_SUBCOMMAND_BUILDERS) + 1)
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, populating only ``command``'s subparser when it is known.
+
+    Unknown commands, top-level flags such as ``--help``, and ``command=None`` get the full
+    subcommand tree so usage/help output stays complete.
+    """
+    parser = argparse.ArgumentParser(prog="roboclaw-gui-mock")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    builder = _SUBCOMMAND_BUILDERS.get(command) if command is not None else None
+    if builder is not None:
+        builder(subparsers)
+        return parser
+
+    for build in _SUBCOMMAND_BUILDERS.values():
+        build(subparsers)
     return parser
 
 
+# json.dumps(..., sort_keys=True) builds a new JSONEncoder per call; bind one once instead.
+_encode_json_line = json.JSONEncoder(sort_keys=True).encode
+
+
 def _parse_address(raw: str) -> int:
     return int(raw, 0)
 
 
-def main(argv: Sequence[str] | None = None, *, facade: ServiceGuiFacade | None = None) -> int:
-    args = _build_parser().parse_args(argv)
-    backend = facade or ServiceGuiFacade()
-    state = AppState()
+def _emit(payload: dict[str, Any]) -> None:
+    # Same wire format as json.dumps(..., sort_keys=True); text writes work with any redirected stdout.
+    sys.stdout.write(_encode_json_line(payload) + "\n")
 
-    if args.command == "list":
-        ports = tuple(backend.list_devices())
-        state = reduce_state(state, PortsDiscovered(ports=ports))
-        print(json.dumps({"ports": list(state.available_ports)}, sort_keys=True))
-        return 0
 
-    port = str(args.port)
-    address = _parse_address(str(args.address))
-    state = reduce_state(state, DeviceSelected(port=port, address=address))
+def _no_report(args: argparse.Namespace, result: dict[str, Any]) -> str | None:
+    return None
+
+
+def _result_report(args: argparse.Namespace, result: dict[str, Any]) -> str | None:
+    return str(result.get("report"))
+
+
+def _out_report(args: argparse.Namespace, result: dict[str, Any]) -> str | None:
+    out_path: str = args.out
+    return out_path
+
+
+def _flash_message(result: dict[str, Any]) -> str:
+    return summarize_flash_result(
+        {
+            "write_nvm_result": result.get("write_nvm_result"),
+            "verification_result": result.get("verification_result"),
+        }
+    )
 
-    if args.command == "info":
-        state = reduce_state(state, JobStarted(command="info", message="Reading firmware"))
-        result = backend.get_device_info(port=port, address=address)
-        if result.get("ok"):
-            state = reduce_state(state, JobSucceeded(message="Info loaded"))
-            print(json.dumps({"result": result, "state": state.job.status}, sort_keys=True))
-            return 0
-        error = dict(result.get("error", {}))
-        state = reduce_state(state, JobFailed(message=summarize_error(error)))
-        print(json.dumps({"error": error, "state": state.job.status}, sort_keys=True))
-        return 1
-
-    if args.command == "status":
-        state = reduce_state(state, JobStarted(command="status", message="Refreshing status"))
-        result = backend.get_live_status(port=port, address=address)
-        if result.get("ok"):
-            state = reduce_state(state, JobSucceeded(message="Status loaded"))
-            print(json.dumps({"result": result, "state": state.job.status}, sort_keys=True))
-            return 0
-        error = dict(result.get("error", {}))
-        state = reduce_state(state, JobFailed(message=summarize_error(error)))
-        print(json.dumps({"error": error, "state": state.job.status}, sort_keys=True))
-        return 1
-
-    if args.command == "dump":
-        state = reduce_state(state, JobStarted(command="dump", message="Dumping config"))
-        result = backend.dump_config(port=port, address=address, out_path=str(args.out))
-        if result.get("ok"):
-            state = reduce_state(state, JobSucceeded(message="Dump complete", report_path=str(args.out)))
-            print(json.dumps({"result": result, "state": state.job.status}, sort_keys=True))
-            return 0
-        error = dict(result.get("error", {}))
-        state = reduce_state(state, JobFailed(message=summarize_error(error)))
-        print(json.dumps({"error": error, "state": state.job.status}, sort_keys=True))
-        return 1
-
-    if args.command == "flash":
-        state = reduce_state(state, JobStarted(command="flash", message="Flashing config"))
-        result = backend.flash_config(
+
+def _test_message(result: dict[str, Any]) -> str:
+    return summarize_test_result({"passed": result.get("passed"), "reason": result.get("reason")})
+
+
+@dataclass(frozen=True, slots=True)
+class _CommandSpec:
+    job_command: str
+    start_message: str
+    invoke: Callable[[ServiceGuiFacade, argparse.Namespace, str, int], dict[str, Any]]
+    success_message: Callable[[dict[str, Any]], str]
+    report_path: Callable[[argparse.Namespace, dict[str, Any]], str | None] = _no_report
+    # Flash/test failures still produce a report artifact, so it is echoed with the error.
+    error_has_report: bool = False
+
+
+_COMMANDS: dict[str, _CommandSpec] = {
+    "info": _CommandSpec(
+        job_command="info",
+        start_message="Reading firmware",
+        invoke=lambda f, a, port, address: f.get_device_info(port=port, address=address),
+        success_message=lambda _result: "Info loaded",
+    ),
+    "status": _CommandSpec(
+        job_command="status",
+        start_message="Refreshing status",
+        invoke=lambda f, a, port, address: f.get_live_status(port=port, address=address),
+        success_message=lambda _result: "Status loaded",
+    ),
+    "dump": _CommandSpec(
+        job_command="dump",
+        start_message="Dumping config",
+        invoke=lambda f, a, port, address: f.dump_config(port=port, address=address, out_path=a.out),
+        success_message=lambda _result: "Dump complete",
+        report_path=_out_report,
+    ),
+    "flash": _CommandSpec(
+        job_command="flash",
+        start_message="Flashing config",
+        invoke=lambda f, a, port, address: f.flash_config(
             port=port,
             address=address,
-            config_path=str(args.config),
-            verify=bool(args.verify),
-            report_dir=str(args.report_dir),
-        )
-        if result.get("ok"):
-            message = summarize_flash_result(
-                {
-                    "write_nvm_result": result.get("write_nvm_result"),
-                    "verification_result": result.get("verification_result"),
-                }
-            )
-            state = reduce_state(state, JobSucceeded(message=message, report_path=str(result.get("report"))))
-            print(json.dumps({"result": result, "state": state.job.status}, sort_keys=True))
-            return 0
-        error = dict(result.get("error", {}))
-        state = reduce_state(state, JobFailed(message=summarize_error(error), report_path=str(result.get("report"))))
-        print(json.dumps({"error": error, "report": result.get("report"), "state": state.job.status}, sort_keys=True))
-        return 1
-
-    if args.command == "test":
-        state = reduce_state(state, JobStarted(command="test", message="Running recipe"))
-        result = backend.run_test(
+            config_path=a.config,
+            verify=a.verify,
+            report_dir=a.report_dir,
+        ),
+        success_message=_flash_message,
+        report_path=_result_report,
+        error_has_report=True,
+    ),
+    "test": _CommandSpec(
+        job_command="test",
+        start_message="Running recipe",
+        invoke=lambda f, a, port, address: f.run_test(
             port=port,
             address=address,
-            recipe=str(args.recipe),
-            report_dir=str(args.report_dir),
-            csv=bool(args.csv),
-        )
-        if result.get("ok"):
-            message = summarize_test_result({"passed": result.get("passed"), "reason": result.get("reason")})
-            state = reduce_state(state, JobSucceeded(message=message, report_path=str(result.get("report"))))
-            print(json.dumps({"result": result, "state": state.job.status}, sort_keys=True))
-            return 0
-        error = dict(result.get("error", {}))
-        state = reduce_state(state, JobFailed(message=summarize_error(error), report_path=str(result.get("report"))))
-        print(json.dumps({"error": error, "report": result.get("report"), "state": state.job.status}, sort_keys=True))
-        return 1
-
-    if args.command == "pwm":
-        state = reduce_state(state, JobStarted(command="pwm_pulse", message="Running PWM pulse"))
-        result = backend.run_pwm_pulse(
+            recipe=a.recipe,
+            report_dir=a.report_dir,
+            csv=a.csv,
+        ),
+        success_message=_test_message,
+        report_path=_result_report,
+        error_has_report=True,
+    ),
+    "pwm": _CommandSpec(
+        job_command="pwm_pulse",
+        start_message="Running PWM pulse",
+        invoke=lambda f, a, port, address: f.run_pwm_pulse(
             port=port,
             address=address,
-            duty_m1=int(args.duty_m1),
-            duty_m2=int(args.duty_m2),
-            runtime_s=float(args.runtime_s),
-        )
-        if result.get("ok"):
-            state = reduce_state(state, JobSucceeded(message="PWM pulse completed"))
-            print(json.dumps({"result": result, "state": state.job.status}, sort_keys=True))
-            return 0
-        error = dict(result.get("error", {}))
-        state = reduce_state(state, JobFailed(message=summarize_error(error)))
-        print(json.dumps({"error": error, "state": state.job.status}, sort_keys=True))
-        return 1
-
-    if args.command == "stop":
-        state = reduce_state(state, JobStarted(command="stop_all", message="Stopping motors"))
-        result = backend.stop_all(port=port, address=address)
-        if result.get("ok"):
-            state = reduce_state(state, JobSucceeded(message="Stop all completed"))
-            print(json.dumps({"result": result, "state": state.job.status}, sort_keys=True))
-            return 0
-        error = dict(result.get("error", {}))
-        state = reduce_state(state, JobFailed(message=summarize_error(error)))
-        print(json.dumps({"error": error, "state": state.job.status}, sort_keys=True))
-        return 1
-
-    return 2
+            duty_m1=a.duty_m1,
+            duty_m2=a.duty_m2,
+            runtime_s=a.runtime_s,
+        ),
+        success_message=lambda _result: "PWM pulse completed",
+    ),
+    "stop": _CommandSpec(
+        job_command="stop_all",
+        start_message="Stopping motors",
+        invoke=lambda f, a, port, address: f.stop_all(port=port, address=address),
+        success_message=lambda _result: "Stop all completed",
+    ),
+}
+
+
+def _job_result(
+    state: AppState,
+    spec: _CommandSpec,
+    args: argparse.Namespace,
+    result: dict[str, Any],
+) -> tuple[int, dict[str, Any]]:
+    if result.get("ok"):
+        success = JobSucceeded(message=spec.success_message(result), report_path=spec.report_path(args, result))
+        state = reduce_state(state, success)
+        return 0, {"result": result, "state": state.job.status}
+
+    error = result.get("error") or {}
+    report_path = spec.report_path(args, result) if spec.error_has_report else None
+    state = reduce_state(state, JobFailed(message=summarize_error(error), report_path=report_path))
+    payload: dict[str, Any] = {"error": error, "state": state.job.status}
+    if spec.error_has_report:
+        payload["report"] = result.get("report")
+    return 1, payload
+
+
+def run(
+    argv: Sequence[str] | None = None,
+    *,
+    facade: ServiceGuiFacade | None = None,
+) -> tuple[int, dict[str, Any] | None]:
+    """Execute one mock GUI command and return its exit code and payload without printing it."""
+    arguments = list(sys.argv[1:] if argv is None else argv)
+    args = _build_parser(_selected_command(arguments)).parse_args(arguments)
+    backend = facade or ServiceGuiFacade()
+    state = AppState()
+
+    if args.command == "list":
+        ports = backend.list_devices()
+        state = reduce_state(state, PortsDiscovered(ports=tuple(ports)))
+        return 0, {"ports": ports}
+
+    spec = _COMMANDS.get(args.command)
+    if spec is None:
+        return 2, None
+
+    port = args.port
+    address = _parse_address(args.address)
+    state = reduce_state(state, DeviceSelected(port=port, address=address))
+    state = reduce_state(state, JobStarted(command=spec.job_command, message=spec.start_message))
+    result = spec.invoke(backend, args, port, address)
+    return _job_result(state, spec, args, result)
+
+
+def main(argv: Sequence[str] | None = None, *, facade: ServiceGuiFacade | None = None) -> int:
+    exit_code, payload = run(argv, facade=facade)
+    if payload is not None:
+        _emit(payload)
+    return exit_code
 
 
 if __name__ == "__main__":
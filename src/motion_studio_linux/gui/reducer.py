@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from typing import Union
+from typing import Any, Callable, Union
 
-from motion_studio_linux.gui.state import AppState, DeviceSelection, JobState
+from motion_studio_linux.gui.state import AppState, DeviceSelection
 
 
 @dataclass(frozen=True, slots=True)
@@ -40,39 +40,53 @@ class JobFailed:
 GuiEvent = Union[PortsDiscovered, DeviceSelected, JobStarted, JobSucceeded, JobFailed]
 
 
+def _on_ports_discovered(state: AppState, event: PortsDiscovered) -> AppState:
+    return replace(state, available_ports=event.ports)
+
+
+def _on_device_selected(state: AppState, event: DeviceSelected) -> AppState:
+    return replace(state, device=DeviceSelection(port=event.port, address=event.address))
+
+
+def _on_job_started(state: AppState, event: JobStarted) -> AppState:
+    job = replace(state.job, status="running", message=event.message, active_command=event.command)
+    return replace(state, job=job)
+
+
+def _on_job_succeeded(state: AppState, event: JobSucceeded) -> AppState:
+    job = replace(
+        state.job,
+        status="success",
+        message=event.message,
+        active_command=None,
+        last_report_path=event.report_path or state.job.last_report_path,
+    )
+    return replace(state, job=job)
+
+
+def _on_job_failed(state: AppState, event: JobFailed) -> AppState:
+    job = replace(
+        state.job,
+        status="error",
+        message=event.message,
+        active_command=None,
+        last_report_path=event.report_path or state.job.last_report_path,
+    )
+    return replace(state, job=job)
+
+
+# Event classes are final dataclasses, so exact-type lookup replaces the isinstance chain.
+_HANDLERS: dict[type, Callable[[AppState, Any], AppState]] = {
+    PortsDiscovered: _on_ports_discovered,
+    DeviceSelected: _on_device_selected,
+    JobStarted: _on_job_started,
+    JobSucceeded: _on_job_succeeded,
+    JobFailed: _on_job_failed,
+}
+
+
 def reduce_state(state: AppState, event: GuiEvent) -> AppState:
-    if isinstance(event, PortsDiscovered):
-        return replace(state, available_ports=event.ports)
-    if isinstance(event, DeviceSelected):
-        return replace(state, device=DeviceSelection(port=event.port, address=event.address))
-    if isinstance(event, JobStarted):
-        return replace(
-            state,
-            job=JobState(
-                status="running",
-                message=event.message,
-                active_command=event.command,
-                last_report_path=state.job.last_report_path,
-            ),
-        )
-    if isinstance(event, JobSucceeded):
-        return replace(
-            state,
-            job=JobState(
-                status="success",
-                message=event.message,
-                active_command=None,
-                last_report_path=event.report_path or state.job.last_report_path,
-            ),
-        )
-    if isinstance(event, JobFailed):
-        return replace(
-            state,
-            job=JobState(
-                status="error",
-                message=event.message,
-                active_command=None,
-                last_report_path=event.report_path or state.job.last_report_path,
-            ),
-        )
-    return state
+    handler = _HANDLERS.get(type(event))
+    if handler is None:
+        return state
+    return handler(state, event)
@@ -7,13 +7,15 @@ from typing import Any, Mapping
 
 from motion_studio_linux.config_schema import CONFIG_SCHEMA_VERSION
 
-SUPPORTED_PARAMETER_KEYS = {
-    "config",
-    "mode",
-    "max_current",
-    "max_current_m1",
-    "max_current_m2",
-}
+SUPPORTED_PARAMETER_KEYS: frozenset[str] = frozenset(
+    {
+        "config",
+        "mode",
+        "max_current",
+        "max_current_m1",
+        "max_current_m2",
+    }
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,18 +28,18 @@ class SetupFormModel:
 
 
 def model_from_config_payload(payload: Mapping[str, Any]) -> SetupFormModel:
-    parameters = _extract_parameters(payload)
-
-    mode_value = parameters.get("mode")
-    mode = int(mode_value) if mode_value is not None else None
+    raw_parameters = payload.get("parameters")
+    # Accept already-sliced parameter payloads to make caller usage flexible.
+    get = raw_parameters.get if isinstance(raw_parameters, Mapping) else payload.get
 
-    unified = parameters.get("max_current")
-    per_m1 = parameters.get("max_current_m1")
-    per_m2 = parameters.get("max_current_m2")
+    mode_value = get("mode")
+    unified = get("max_current")
+    per_m1 = get("max_current_m1")
+    per_m2 = get("max_current_m2")
 
     use_unified = unified is not None or (per_m1 is None and per_m2 is None)
     return SetupFormModel(
-        mode=mode,
+        mode=int(mode_value) if mode_value is not None else None,
         use_unified_current=use_unified,
         max_current=int(unified) if unified is not None else None,
         max_current_m1=int(per_m1) if per_m1 is not None else None,
@@ -63,14 +65,6 @@ def config_payload_from_model(model: SetupFormModel) -> dict[str, Any]:
 
 
 def unsupported_parameter_keys(payload: Mapping[str, Any]) -> list[str]:
-    parameters = _extract_parameters(payload)
-    unknown = sorted(set(parameters.keys()) - SUPPORTED_PARAMETER_KEYS)
-    return list(unknown)
-
-
-def _extract_parameters(payload: Mapping[str, Any]) -> Mapping[str, Any]:
     raw_parameters = payload.get("parameters")
-    if isinstance(raw_parameters, Mapping):
-        return raw_parameters
-    # Accept already-sliced parameter payloads to make caller usage flexible.
-    return payload
+    parameters = raw_parameters if isinstance(raw_parameters, Mapping) else payload
+    return sorted(parameters.keys() - SUPPORTED_PARAMETER_KEYS)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,8 +19,13 @@ class JobState:
     last_report_path: str | None = None
 
 
+# Frozen defaults are safe to share across every fresh AppState.
+_DEFAULT_DEVICE = DeviceSelection()
+_DEFAULT_JOB = JobState()
+
+
 @dataclass(frozen=True, slots=True)
 class AppState:
     available_ports: tuple[str, ...] = ()
-    device: DeviceSelection = field(default_factory=DeviceSelection)
-    job: JobState = field(default_factory=JobState)
+    device: DeviceSelection = _DEFAULT_DEVICE
+    job: JobState = _DEFAULT_JOB
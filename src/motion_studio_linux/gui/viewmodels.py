@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
+_format_flash_write = "Flash: write={}".format
+_format_flash_verify = "Flash: write={}, verify={}".format
+_format_test = "Test: {} ({})".format
+_format_error = "{}: {}".format
 
-def summarize_flash_result(report: dict[str, Any]) -> str:
+
+def summarize_flash_result(report: Mapping[str, Any]) -> str:
     write_result = report.get("write_nvm_result", "unknown")
     verify_result = report.get("verification_result")
     if verify_result in (None, "skipped"):
-        return f"Flash: write={write_result}"
-    return f"Flash: write={write_result}, verify={verify_result}"
+        return _format_flash_write(write_result)
+    return _format_flash_verify(write_result, verify_result)
 
 
-def summarize_test_result(report: dict[str, Any]) -> str:
+def summarize_test_result(report: Mapping[str, Any]) -> str:
     passed = bool(report.get("passed", False))
     reason = str(report.get("reason", "unknown"))
-    return f"Test: {'pass' if passed else 'fail'} ({reason})"
+    return _format_test("pass" if passed else "fail", reason)
 
 
-def summarize_error(error_payload: dict[str, Any]) -> str:
+def summarize_error(error_payload: Mapping[str, Any]) -> str:
     code = str(error_payload.get("code", "error"))
     message = str(error_payload.get("message", "Unknown error"))
-    return f"{code}: {message}"
+    return _format_error(code, message)
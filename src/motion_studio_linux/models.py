@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
 from hashlib import sha256
 from json import dumps
+from types import MappingProxyType
 from typing import Any
 
 DEFAULT_ADDRESS = 0x80
 
 
+def json_default(value: Any) -> Any:
+    """JSON encoder fallback that serializes read-only mappings as plain objects."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _shallow_dict(instance: Any) -> dict[str, Any]:
+    # Report fields are already JSON-safe, so skip the recursive deep copy done by asdict().
+    return {item.name: getattr(instance, item.name) for item in fields(instance)}
+
+
 def utc_timestamp() -> str:
     """Return an ISO-8601 UTC timestamp with second precision."""
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+
+def utc_timestamp_compact() -> str:
+    """Return the filename form of :func:`utc_timestamp` (``YYYY-MM-DDTHHMMSSZ``)."""
+    return time.strftime("%Y-%m-%dT%H%M%SZ", time.gmtime())
 
 
 @dataclass(frozen=True, slots=True)
@@ -40,23 +59,33 @@ class FirmwareInfo:
 @dataclass(frozen=True, slots=True)
 class ConfigPayload:
     schema_version: str
-    parameters: dict[str, Any]
+    parameters: Mapping[str, Any]
+    # Parameters are frozen on construction, so the first computed hash stays valid.
+    _config_hash: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.schema_version:
             raise ValueError("schema_version is required.")
+        if isinstance(self.parameters, dict):
+            object.__setattr__(self, "parameters", MappingProxyType(dict(self.parameters)))
 
     @property
     def config_hash(self) -> str:
+        if self._config_hash is not None:
+            return self._config_hash
+        # Always the stdlib encoding: the hash must not depend on whether orjson is installed.
         normalized = dumps(
             {
                 "schema_version": self.schema_version,
                 "parameters": self.parameters,
             },
+            default=json_default,
             sort_keys=True,
             separators=(",", ":"),
-        )
-        return sha256(normalized.encode("utf-8")).hexdigest()
+        ).encode("utf-8")
+        digest = sha256(normalized).hexdigest()
+        object.__setattr__(self, "_config_hash", digest)
+        return digest
 
 
 @dataclass(frozen=True, slots=True)
@@ -77,20 +106,20 @@ class FlashReport:
     firmware: str
     config_hash: str
     config_version: str
-    applied_parameters: dict[str, Any]
+    applied_parameters: Mapping[str, Any]
     write_nvm_result: str
     verification_result: str | None = None
     schema_version: str = "flash_report_v1"
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return _shallow_dict(self)
 
 
 @dataclass(frozen=True, slots=True)
 class TestReport:
     timestamp: str
     recipe_id: str
-    safety_limits: dict[str, Any]
+    safety_limits: Mapping[str, Any]
     passed: bool
     reason: str
     telemetry_summary: dict[str, Any]
@@ -98,4 +127,4 @@ class TestReport:
     schema_version: str = "test_report_v1"
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return _shallow_dict(self)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 
 @dataclass(frozen=True, slots=True)
@@ -15,7 +17,7 @@ class RecipeStep:
 @dataclass(frozen=True, slots=True)
 class Recipe:
     recipe_id: str
-    safety_limits: dict[str, int]
+    safety_limits: Mapping[str, int]
     telemetry_fields: tuple[str, ...]
     steps: tuple[RecipeStep, ...]
 
@@ -23,7 +25,7 @@ class Recipe:
 def smoke_v1_recipe() -> Recipe:
     return Recipe(
         recipe_id="smoke_v1",
-        safety_limits={"max_duty": 20, "max_runtime_s": 2},
+        safety_limits=MappingProxyType({"max_duty": 20, "max_runtime_s": 2}),
         telemetry_fields=("battery_voltage", "motor1_current", "encoder1"),
         steps=(
             RecipeStep(channel=1, duty=20, duration_s=0.2),
@@ -32,7 +34,12 @@ def smoke_v1_recipe() -> Recipe:
     )
 
 
+# Recipes are immutable, so built-ins are constructed once and shared.
+_RECIPES: dict[str, Recipe] = {"smoke_v1": smoke_v1_recipe()}
+
+
 def resolve_recipe(recipe_id: str) -> Recipe:
-    if recipe_id == "smoke_v1":
-        return smoke_v1_recipe()
-    raise ValueError(f"Unsupported recipe: {recipe_id}")
+    try:
+        return _RECIPES[recipe_id]
+    except KeyError:
+        raise ValueError(f"Unsupported recipe: {recipe_id}") from None
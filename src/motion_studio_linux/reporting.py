@@ -3,12 +3,55 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
+import os
+from collections.abc import Iterable, Sequence
 from dataclasses import asdict, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import Any, BinaryIO, Protocol, TextIO
 
-from motion_studio_linux.models import utc_timestamp
+from motion_studio_linux.models import json_default, utc_timestamp_compact
+
+_orjson: ModuleType | None
+try:
+    import orjson as _orjson
+except ModuleNotFoundError:  # pragma: no cover - exercised when optional dependency is absent
+    _orjson = None
+
+
+_encode_pretty = json.JSONEncoder(default=json_default, indent=2, sort_keys=True, ensure_ascii=False).encode
+_encode_compact = json.JSONEncoder(
+    default=json_default,
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+).encode
+
+
+def encode_json(payload: Any, *, indent: bool = True) -> bytes:
+    """Serialize ``payload`` as sorted-key UTF-8 JSON, using orjson when installed."""
+    if _orjson is not None:
+        option = _orjson.OPT_SORT_KEYS | (_orjson.OPT_INDENT_2 if indent else 0)
+        encoded: bytes = _orjson.dumps(payload, default=json_default, option=option)
+        return encoded
+    text = _encode_pretty(payload) if indent else _encode_compact(payload)
+    return text.encode("utf-8")
+
+
+_STRIP_COLONS = {ord(":"): None}
+
+
+@lru_cache(maxsize=64)
+def _port_token(port: str) -> str:
+    return port.replace("/dev/", "").replace("/", "_")
+
+
+@lru_cache(maxsize=64)
+def _addr_suffix(address: int) -> str:
+    return f"0x{address:02X}"
 
 
 def artifact_path(
@@ -20,29 +63,105 @@ def artifact_path(
     timestamp: str | None = None,
     extension: str = "json",
 ) -> Path:
-    ts = timestamp or utc_timestamp()
-    if ts.endswith("+00:00"):
-        ts = ts[:-6] + "Z"
-    ts = ts.replace(":", "")
-    port_token = port.replace("/dev/", "").replace("/", "_")
-    filename = f"{ts}_{kind}_{port_token}_0x{address:02X}.{extension}"
+    if timestamp:
+        ts = timestamp[:-6] + "Z" if timestamp.endswith("+00:00") else timestamp
+        ts = ts.translate(_STRIP_COLONS)
+    else:
+        ts = utc_timestamp_compact()
+    filename = f"{ts}_{kind}_{_port_token(port)}_{_addr_suffix(address)}.{extension}"
     return report_dir / filename
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    # Write a sibling temp file and rename it over the target so readers never see a partial report.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _encode_report(report: Any) -> bytes:
+    payload = report
+    if is_dataclass(report) and not isinstance(report, type):
+        to_dict = getattr(report, "to_dict", None)
+        payload = to_dict() if callable(to_dict) else asdict(report)
+    return encode_json(payload) + b"\n"
+
+
+def write_json_stream(handle: BinaryIO, report: Any) -> None:
+    """Write ``report`` as pretty, sorted JSON to an open binary ``handle``."""
+    handle.write(_encode_report(report))
+
+
 def write_json_report(path: Path, report: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload = asdict(report) if is_dataclass(report) else report
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    _write_atomic(path, _encode_report(report))
 
 
-def write_csv_report(path: Path, rows: list[dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if not rows:
-        path.write_text("", encoding="utf-8")
+def write_csv_stream(
+    handle: TextIO,
+    rows: Iterable[dict[str, Any]],
+    *,
+    fieldnames: Sequence[str] | None = None,
+) -> None:
+    """Render ``rows`` as CSV to an open text ``handle`` in one pass; no rows writes nothing.
+
+    Without explicit ``fieldnames`` ``rows`` must be a sequence: the header is the first
+    row's keys, sorted, followed by any keys first seen in later rows, in order. Iterators
+    and generators need ``fieldnames`` since their header cannot be known up front.
+    """
+    if fieldnames is None and not isinstance(rows, Sequence):
+        raise ValueError("fieldnames is required when rows is not a sequence")
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
         return
 
-    fieldnames = sorted({key for row in rows for key in row.keys()})
-    with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    if fieldnames is not None:
+        header = list(fieldnames)
+    else:
+        header = list(dict.fromkeys([*sorted(first), *(key for row in rows for key in row)]))
+    writer = csv.DictWriter(handle, fieldnames=header)
+    writer.writeheader()
+    writer.writerow(first)
+    writer.writerows(it)
+
+
+def write_csv_report(
+    path: Path,
+    rows: Iterable[dict[str, Any]],
+    *,
+    fieldnames: Sequence[str] | None = None,
+) -> None:
+    """Render ``rows`` with ``write_csv_stream`` and write the file in a single atomic write."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    buffer = io.StringIO(newline="")
+    write_csv_stream(buffer, rows, fieldnames=fieldnames)
+    _write_atomic(path, buffer.getvalue().encode("utf-8"))
+
+
+class ReportSink(Protocol):
+    """Destination for JSON/CSV report artifacts produced by CLI commands."""
+
+    def write_json(self, path: Path, report: Any) -> None: ...
+
+    def write_csv(self, path: Path, rows: Iterable[dict[str, Any]]) -> None: ...
+
+
+class FileReportSink:
+    """Default sink: serialize artifacts to disk at their deterministic paths."""
+
+    def write_json(self, path: Path, report: Any) -> None:
+        write_json_report(path, report)
+
+    def write_csv(self, path: Path, rows: Iterable[dict[str, Any]]) -> None:
+        write_csv_report(path, rows)
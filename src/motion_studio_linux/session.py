@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from motion_studio_linux.errors import NoResponseError
@@ -48,7 +49,7 @@ class RoboClawSession:
             raise NoResponseError("Session is not connected.")
         return self._transport.get_config_snapshot()
 
-    def apply_config(self, parameters: dict[str, Any]) -> None:
+    def apply_config(self, parameters: Mapping[str, Any]) -> None:
         if self._connected_port is None:
             raise NoResponseError("Session is not connected.")
         self._transport.apply_config(parameters)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from motion_studio_linux.models import TelemetrySnapshot
+from motion_studio_linux.models import TelemetrySnapshot, utc_timestamp
 from motion_studio_linux.session import RoboClawSession
 
 
@@ -11,6 +11,10 @@ class Telemetry:
         self._session = session
 
     def poll(self, *snapshot_fields: str) -> TelemetrySnapshot:
-        fields = tuple(snapshot_fields)
-        values = self._session.read_telemetry(fields)
-        return TelemetrySnapshot.from_fields(**values)
+        return self.poll_fields(snapshot_fields)
+
+    def poll_fields(self, fields: tuple[str, ...]) -> TelemetrySnapshot:
+        """Poll an already-built field tuple; an empty tuple skips the transport round-trip."""
+        if not fields:
+            return TelemetrySnapshot(timestamp=utc_timestamp(), fields={})
+        return TelemetrySnapshot(timestamp=utc_timestamp(), fields=self._session.read_telemetry(fields))
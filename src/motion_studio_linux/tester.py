@@ -27,7 +27,7 @@ class Tester:
                         details={"duty": step.duty, "limit": recipe.safety_limits["max_duty"]},
                     )
                 self._session.set_duty(step.channel, step.duty)
-                snapshot = self._telemetry.poll(*recipe.telemetry_fields)
+                snapshot = self._telemetry.poll_fields(recipe.telemetry_fields)
                 telemetry_summary = snapshot.fields
             return TestReport(
                 timestamp=utc_timestamp(),
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Protocol
 
 from motion_studio_linux.errors import NoResponseError
@@ -20,7 +21,7 @@ class RoboClawTransport(Protocol):
     def get_config_snapshot(self) -> dict[str, Any]:
         """Read project-supported config subset from the active target."""
 
-    def apply_config(self, parameters: dict[str, Any]) -> None:
+    def apply_config(self, parameters: Mapping[str, Any]) -> None:
         """Apply project-supported config subset to active target."""
 
     def write_nvm(self, key: int) -> None:
@@ -60,7 +61,7 @@ class UnconfiguredTransport:
     def get_config_snapshot(self) -> dict[str, Any]:
         raise NoResponseError("No active transport connection.")
 
-    def apply_config(self, parameters: dict[str, Any]) -> None:
+    def apply_config(self, parameters: Mapping[str, Any]) -> None:
         raise NoResponseError("No active transport connection.")
 
     def write_nvm(self, key: int) -> None:
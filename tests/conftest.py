@@ -1,9 +1,111 @@
 from __future__ import annotations
 
+import json
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from types import ModuleType
+from typing import Any
+from unittest.mock import NonCallableMagicMock, create_autospec
 
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 sys.path.insert(0, str(SRC))
+
+# Tests are independent: each one builds its own fakes and writes only under tmp_path, so the
+# suite can run under ``pytest -n auto --dist=worksteal``. Session fixtures below are built per
+# worker and hold only read-only data.
+
+
+def _fresh_factory(fake_cls: type[Any]) -> Callable[..., Any]:
+    # Every call builds a new fake, so two fakes in one test never alias each other.
+    def build(**overrides: Any) -> Any:
+        return fake_cls().reset(**overrides)
+
+    return build
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Retry backoff and PWM pulse runtimes are pure waits under fakes; opt out with real_sleep.
+    if "real_sleep" in request.keywords:
+        return
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+
+
+@pytest.fixture
+def fake_session_factory(request: pytest.FixtureRequest) -> Callable[..., Any]:
+    """Return a factory building a new ``FakeSession`` from the requesting module per call."""
+    return _fresh_factory(request.module.FakeSession)
+
+
+@pytest.fixture
+def fake_controller_factory(request: pytest.FixtureRequest) -> Callable[..., Any]:
+    """Return a factory building a new ``FakeController`` from the requesting module per call."""
+    return _fresh_factory(request.module.FakeController)
+
+
+@pytest.fixture(scope="session")
+def valid_flash_config(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the canonical schema v1 flash config once per session and share its path."""
+    path = tmp_path_factory.mktemp("cfg") / "cfg.json"
+    path.write_text(
+        json.dumps({"schema_version": "v1", "parameters": {"max_current": 35, "mode": 1}}),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def parsed_schemas() -> dict[str, Any]:
+    """Parse every ``schemas/*.schema.json`` once per session, keyed by file name."""
+    return {
+        path.name: json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted((ROOT / "schemas").glob("*.schema.json"))
+    }
+
+
+@pytest.fixture(scope="session")
+def cli_mod() -> ModuleType:
+    """Return the ``motion_studio_linux.cli`` module for tests that patch its globals."""
+    import motion_studio_linux.cli as module
+
+    return module
+
+
+@pytest.fixture
+def fake_facade() -> NonCallableMagicMock:
+    """Return an autospec'd ``ServiceGuiFacade`` whose methods report happy-path payloads."""
+    from motion_studio_linux.gui.facade import ServiceGuiFacade
+
+    facade: NonCallableMagicMock = create_autospec(ServiceGuiFacade, instance=True)
+    facade.list_devices.return_value = ["/dev/ttyACM0", "/dev/ttyUSB0"]
+    facade.get_device_info.return_value = {
+        "ok": True,
+        "port": "/dev/ttyACM0",
+        "address": "0x80",
+        "firmware": "v4.4.3",
+    }
+    facade.dump_config.return_value = {"ok": True, "out_path": "config.json", "config_hash": "abc"}
+    facade.flash_config.return_value = {
+        "ok": True,
+        "report": "reports/flash.json",
+        "write_nvm_result": "ok",
+        "verification_result": "pass",
+    }
+    facade.run_test.return_value = {
+        "ok": True,
+        "report": "reports/test.json",
+        "passed": True,
+        "reason": "completed",
+    }
+    facade.get_live_status.return_value = {
+        "ok": True,
+        "firmware": "v4.4.3",
+        "telemetry": {"battery_voltage": 480, "error_bits": 0},
+    }
+    facade.run_pwm_pulse.return_value = {"ok": True, "telemetry": {"battery_voltage": 480, "error_bits": 0}}
+    facade.stop_all.return_value = {"ok": True, "stopped": True}
+    return facade
@@ -1,18 +1,33 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
 import pytest
 
-from motion_studio_linux.basicmicro_transport import BasicmicroTransport, build_basicmicro_transport_from_env
+try:
+    from basicmicro.exceptions import PacketTimeoutError
+except ModuleNotFoundError:  # pragma: no cover - exercised when dependency is absent
+    PacketTimeoutError = Exception
+
+from motion_studio_linux.basicmicro_transport import (
+    _BASICMICRO_AVAILABLE,
+    BasicmicroTransport,
+    build_basicmicro_transport_from_env,
+)
 from motion_studio_linux.errors import ModeMismatchError, NoResponseError, OperationTimeoutError
 
 
 class FakeController:
-    def __init__(
+    def __init__(self, **overrides: Any) -> None:
+        self.reset(**overrides)
+
+    def reset(
         self,
-        config_value: int = 0x0003,
         *,
+        config_value: int = 0x0003,
         fail_mixed_stop: bool = False,
-    ) -> None:
+    ) -> FakeController:
         self.config_value = config_value
         self.m1_limits = (True, 35, 5)
         self.m2_limits = (True, 36, 6)
@@ -22,6 +37,8 @@ class FakeController:
         self.duty_m1_calls: list[int] = []
         self.duty_m2_calls: list[int] = []
         self.mixed_stop_calls: int = 0
+        self.currents_reads = 0
+        return self
 
     def Open(self) -> bool:
         return True
@@ -82,6 +99,7 @@ class FakeController:
         return (True, 50)
 
     def ReadCurrents(self, _address: int) -> tuple[bool, int, int]:
+        self.currents_reads += 1
         return (True, 12, 8)
 
     def ReadEncM1(self, _address: int) -> tuple[bool, int, int]:
@@ -95,8 +113,8 @@ class FakeController:
 
 
 @pytest.mark.unit
-def test_transport_reads_firmware_and_snapshot() -> None:
-    controller = FakeController()
+def test_transport_reads_firmware_and_snapshot(fake_controller_factory: Callable[..., FakeController]) -> None:
+    controller = fake_controller_factory()
     transport = BasicmicroTransport(controller_factory=lambda *_args: controller)
     transport.open("/dev/ttyACM0", 0x80)
 
@@ -109,8 +127,8 @@ def test_transport_reads_firmware_and_snapshot() -> None:
 
 
 @pytest.mark.unit
-def test_transport_apply_config_mode_and_max_current() -> None:
-    controller = FakeController(config_value=0x0001)
+def test_transport_apply_config_mode_and_max_current(fake_controller_factory: Callable[..., FakeController]) -> None:
+    controller = fake_controller_factory(config_value=0x0001)
     transport = BasicmicroTransport(controller_factory=lambda *_args: controller)
     transport.open("/dev/ttyACM0", 0x80)
 
@@ -121,16 +139,16 @@ def test_transport_apply_config_mode_and_max_current() -> None:
 
 
 @pytest.mark.unit
-def test_transport_motion_mode_check() -> None:
-    controller = FakeController(config_value=0x0002)
+def test_transport_motion_mode_check(fake_controller_factory: Callable[..., FakeController]) -> None:
+    controller = fake_controller_factory(config_value=0x0002)
     transport = BasicmicroTransport(controller_factory=lambda *_args: controller)
     transport.open("/dev/ttyACM0", 0x80)
     assert transport.is_motion_enabled() is False
 
 
 @pytest.mark.unit
-def test_transport_telemetry_mapping() -> None:
-    controller = FakeController()
+def test_transport_telemetry_mapping(fake_controller_factory: Callable[..., FakeController]) -> None:
+    controller = fake_controller_factory()
     transport = BasicmicroTransport(controller_factory=lambda *_args: controller)
     transport.open("/dev/ttyACM0", 0x80)
 
@@ -144,15 +162,15 @@ def test_transport_telemetry_mapping() -> None:
         "motor2_current": 8,
         "encoder1": 101,
     }
+    assert controller.currents_reads == 1
 
 
 @pytest.mark.unit
+@pytest.mark.skipif(not _BASICMICRO_AVAILABLE, reason="basicmicro is not installed")
 def test_transport_open_maps_packet_timeout_to_typed_error() -> None:
-    basicmicro_ex = pytest.importorskip("basicmicro.exceptions")
-
     class TimeoutController(FakeController):
         def Open(self) -> bool:
-            raise basicmicro_ex.PacketTimeoutError("timed out")
+            raise PacketTimeoutError("timed out")
 
     transport = BasicmicroTransport(controller_factory=lambda *_args: TimeoutController())
     with pytest.raises(OperationTimeoutError):
@@ -160,8 +178,8 @@ def test_transport_open_maps_packet_timeout_to_typed_error() -> None:
 
 
 @pytest.mark.unit
-def test_transport_write_nvm_rejects_unexpected_key() -> None:
-    controller = FakeController()
+def test_transport_write_nvm_rejects_unexpected_key(fake_controller_factory: Callable[..., FakeController]) -> None:
+    controller = fake_controller_factory()
     transport = BasicmicroTransport(controller_factory=lambda *_args: controller)
     transport.open("/dev/ttyACM0", 0x80)
 
@@ -170,8 +188,8 @@ def test_transport_write_nvm_rejects_unexpected_key() -> None:
 
 
 @pytest.mark.unit
-def test_transport_set_duty_requires_motion_enabled_mode() -> None:
-    controller = FakeController(config_value=0x0001)
+def test_transport_set_duty_requires_motion_enabled_mode(fake_controller_factory: Callable[..., FakeController]) -> None:
+    controller = fake_controller_factory(config_value=0x0001)
     transport = BasicmicroTransport(controller_factory=lambda *_args: controller)
     transport.open("/dev/ttyACM0", 0x80)
 
@@ -180,8 +198,8 @@ def test_transport_set_duty_requires_motion_enabled_mode() -> None:
 
 
 @pytest.mark.unit
-def test_transport_set_duty_rejects_unsupported_channel() -> None:
-    controller = FakeController()
+def test_transport_set_duty_rejects_unsupported_channel(fake_controller_factory: Callable[..., FakeController]) -> None:
+    controller = fake_controller_factory()
     transport = BasicmicroTransport(controller_factory=lambda *_args: controller)
     transport.open("/dev/ttyACM0", 0x80)
 
@@ -190,8 +208,8 @@ def test_transport_set_duty_rejects_unsupported_channel() -> None:
 
 
 @pytest.mark.unit
-def test_transport_stop_falls_back_to_individual_channels() -> None:
-    controller = FakeController(fail_mixed_stop=True)
+def test_transport_stop_falls_back_to_individual_channels(fake_controller_factory: Callable[..., FakeController]) -> None:
+    controller = fake_controller_factory(fail_mixed_stop=True)
     transport = BasicmicroTransport(controller_factory=lambda *_args: controller)
     transport.open("/dev/ttyACM0", 0x80)
 
@@ -203,8 +221,8 @@ def test_transport_stop_falls_back_to_individual_channels() -> None:
 
 
 @pytest.mark.unit
-def test_transport_read_telemetry_rejects_unknown_field() -> None:
-    controller = FakeController()
+def test_transport_read_telemetry_rejects_unknown_field(fake_controller_factory: Callable[..., FakeController]) -> None:
+    controller = fake_controller_factory()
     transport = BasicmicroTransport(controller_factory=lambda *_args: controller)
     transport.open("/dev/ttyACM0", 0x80)
 
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable, Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 
-import motion_studio_linux.cli as cli_module
-from motion_studio_linux.cli import main
+from motion_studio_linux.cli import main, run
 from motion_studio_linux.errors import NoResponseError, OperationTimeoutError
+from motion_studio_linux.flasher import NVM_WRITE_KEY
+
+_DEFAULT_PARAMETERS: Mapping[str, int] = MappingProxyType({"max_current": 40, "mode": 1})
+_MISMATCH_READBACK: Mapping[str, int] = MappingProxyType({"max_current": 99, "mode": 1})
 
 
 class FakeDeviceManager:
@@ -19,14 +25,18 @@ class FakeDeviceManager:
 
 
 class FakeSession:
-    def __init__(
+    def __init__(self, **overrides: Any) -> None:
+        self.reset(**overrides)
+
+    def reset(
         self,
+        *,
         firmware: str = "v3.0.0",
         should_fail: bool = False,
         motion_enabled: bool = True,
         verify_mismatch: bool = False,
         verify_error: bool = False,
-    ) -> None:
+    ) -> FakeSession:
         self.firmware = firmware
         self.should_fail = should_fail
         self.motion_enabled = motion_enabled
@@ -37,8 +47,10 @@ class FakeSession:
         self.stop_calls = 0
         self.write_nvm_calls = 0
         self.reload_calls = 0
-        self.applied_parameters: dict[str, int] = {"max_current": 40, "mode": 1}
+        self.applied_parameters: Mapping[str, int] = _DEFAULT_PARAMETERS
         self.duty_commands: list[tuple[int, int]] = []
+        self._telemetry_cache: dict[tuple[str, ...], Mapping[str, int]] = {}
+        return self
 
     def connect(self, port: str) -> None:
         if self.should_fail:
@@ -51,18 +63,18 @@ class FakeSession:
     def get_firmware(self) -> str:
         return self.firmware
 
-    def dump_config(self) -> dict[str, int]:
+    def dump_config(self) -> Mapping[str, int]:
         if self.verify_error:
             raise NoResponseError("Verification readback failed.", details={"phase": "dump"})
         if self.verify_mismatch:
-            return {"max_current": 99, "mode": 1}
+            return _MISMATCH_READBACK
         return self.applied_parameters
 
-    def apply_config(self, parameters: dict[str, int]) -> None:
+    def apply_config(self, parameters: Mapping[str, int]) -> None:
         self.applied_parameters = parameters
 
     def write_nvm(self, key: int) -> None:
-        assert key == 0xE22EAB7A
+        assert key == NVM_WRITE_KEY
         self.write_nvm_calls += 1
 
     def reload_from_nvm(self) -> None:
@@ -79,8 +91,29 @@ class FakeSession:
     def safe_stop(self) -> None:
         self.stop_calls += 1
 
-    def read_telemetry(self, fields: tuple[str, ...]) -> dict[str, int]:
-        return {field: idx for idx, field in enumerate(fields, start=1)}
+    def read_telemetry(self, fields: tuple[str, ...]) -> Mapping[str, int]:
+        cached = self._telemetry_cache.get(fields)
+        if cached is None:
+            cached = self._telemetry_cache[fields] = MappingProxyType(
+                {field: idx for idx, field in enumerate(fields, start=1)}
+            )
+        return cached
+
+
+class InMemoryReportSink:
+    def __init__(self) -> None:
+        self.reports: dict[Path, dict[str, Any]] = {}
+        self.csv_rows: dict[Path, list[dict[str, Any]]] = {}
+
+    def write_json(self, path: Path, report: Any) -> None:
+        self.reports[path] = report.to_dict() if hasattr(report, "to_dict") else dict(report)
+
+    def write_csv(self, path: Path, rows: Iterable[dict[str, Any]]) -> None:
+        self.csv_rows[path] = list(rows)
+
+    def only_report(self) -> dict[str, Any]:
+        assert len(self.reports) == 1
+        return next(iter(self.reports.values()))
 
 
 @pytest.mark.integration
@@ -94,18 +127,28 @@ def test_cli_list_outputs_sorted_ports(capsys) -> None:
 
 
 @pytest.mark.integration
-def test_cli_info_outputs_json(capsys) -> None:
-    fake = FakeSession(firmware="v4.2.0")
-    code = main(
+def test_cli_list_without_ports_prints_nothing(capsys) -> None:
+    result = run(["list"], device_manager=FakeDeviceManager([]))
+    assert result.exit_code == 0
+    assert result.output == {"ports": []}
+
+    code = main(["list"], device_manager=FakeDeviceManager([]))
+    assert code == 0
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.integration
+def test_cli_info_outputs_json(fake_session_factory) -> None:
+    fake = fake_session_factory(firmware="v4.2.0")
+    result = run(
         ["info", "--port", "/dev/ttyACM0", "--address", "0x80"],
         session_factory=lambda _address: fake,
     )
-    output = capsys.readouterr()
 
-    assert code == 0
+    assert result.exit_code == 0
     assert fake.disconnect_calls == 1
-    payload = json.loads(output.out)
-    assert payload == {
+    assert result.error is None
+    assert result.output == {
         "address": "0x80",
         "firmware": "v4.2.0",
         "port": "/dev/ttyACM0",
@@ -113,8 +156,8 @@ def test_cli_info_outputs_json(capsys) -> None:
 
 
 @pytest.mark.integration
-def test_cli_info_error_serializes_to_stderr(capsys) -> None:
-    fake = FakeSession(should_fail=True)
+def test_cli_info_error_serializes_to_stderr(capsys, fake_session_factory) -> None:
+    fake = fake_session_factory(should_fail=True)
     code = main(
         ["info", "--port", "/dev/ttyACM9", "--address", "0x80"],
         session_factory=lambda _address: fake,
@@ -143,9 +186,26 @@ def test_cli_info_timeout_uses_typed_exit_code(capsys) -> None:
     assert payload["code"] == "timeout"
 
 
+@pytest.mark.unit
+def test_cli_error_line_on_stderr_is_stable(capsys) -> None:
+    class TimeoutSession(FakeSession):
+        def connect(self, port: str) -> None:
+            raise OperationTimeoutError("Timed out waiting for response", details={"port": port})
+
+    code = main(["info", "--port", "/dev/ttyACM0"], session_factory=lambda _address: TimeoutSession())
+    output = capsys.readouterr()
+
+    assert code == 10
+    assert output.out == ""
+    assert output.err == (
+        '{"code": "timeout", "details": {"port": "/dev/ttyACM0"}, '
+        '"message": "Timed out waiting for response"}\n'
+    )
+
+
 @pytest.mark.integration
-def test_cli_dump_writes_file(tmp_path) -> None:
-    fake = FakeSession(firmware="v4.2.0")
+def test_cli_dump_writes_file(tmp_path, fake_session_factory) -> None:
+    fake = fake_session_factory(firmware="v4.2.0")
     out_file = tmp_path / "config.json"
     code = main(
         ["dump", "--port", "/dev/ttyACM0", "--address", "0x80", "--out", str(out_file)],
@@ -161,16 +221,12 @@ def test_cli_dump_writes_file(tmp_path) -> None:
 
 
 @pytest.mark.integration
-def test_cli_flash_writes_report(tmp_path: Path, capsys) -> None:
-    fake = FakeSession(firmware="v4.4.1")
-    config_path = tmp_path / "cfg.json"
-    config_path.write_text(
-        json.dumps({"schema_version": "v1", "parameters": {"max_current": 35, "mode": 1}}),
-        encoding="utf-8",
-    )
+@pytest.mark.slow
+def test_cli_flash_writes_report(tmp_path: Path, fake_session_factory, valid_flash_config: Path) -> None:
+    fake = fake_session_factory(firmware="v4.4.1")
 
     report_dir = tmp_path / "reports"
-    code = main(
+    result = run(
         [
             "flash",
             "--port",
@@ -178,18 +234,17 @@ def test_cli_flash_writes_report(tmp_path: Path, capsys) -> None:
             "--address",
             "0x80",
             "--config",
-            str(config_path),
+            str(valid_flash_config),
             "--verify",
             "--report-dir",
             str(report_dir),
         ],
         session_factory=lambda _address: fake,
     )
-    output = capsys.readouterr()
 
-    assert code == 0
-    result = json.loads(output.out)
-    report_path = Path(result["report"])
+    assert result.exit_code == 0
+    assert result.output is not None
+    report_path = Path(result.output["report"])
     assert report_path.exists()
 
     report_payload = json.loads(report_path.read_text(encoding="utf-8"))
@@ -212,15 +267,13 @@ def test_cli_flash_writes_report(tmp_path: Path, capsys) -> None:
 
 
 @pytest.mark.integration
-def test_cli_flash_verify_mismatch_returns_nonzero(tmp_path: Path, capsys) -> None:
-    fake = FakeSession(verify_mismatch=True)
-    config_path = tmp_path / "cfg.json"
-    config_path.write_text(
-        json.dumps({"schema_version": "v1", "parameters": {"max_current": 35, "mode": 1}}),
-        encoding="utf-8",
-    )
+@pytest.mark.slow
+def test_cli_flash_verify_mismatch_returns_nonzero(
+    tmp_path: Path, fake_session_factory, valid_flash_config: Path
+) -> None:
+    fake = fake_session_factory(verify_mismatch=True)
     report_dir = tmp_path / "reports"
-    code = main(
+    result = run(
         [
             "flash",
             "--port",
@@ -228,28 +281,25 @@ def test_cli_flash_verify_mismatch_returns_nonzero(tmp_path: Path, capsys) -> No
             "--address",
             "0x80",
             "--config",
-            str(config_path),
+            str(valid_flash_config),
             "--verify",
             "--report-dir",
             str(report_dir),
         ],
         session_factory=lambda _address: fake,
     )
-    output = capsys.readouterr()
-    assert code == 15
-    err = json.loads(output.err)
-    assert err["code"] == "verification_mismatch"
+    assert result.exit_code == 15
+    assert result.error is not None
+    assert result.error["code"] == "verification_mismatch"
 
 
 @pytest.mark.integration
-def test_cli_flash_verify_error_returns_nonzero_and_report(tmp_path: Path, capsys) -> None:
-    fake = FakeSession(verify_error=True)
-    config_path = tmp_path / "cfg.json"
-    config_path.write_text(
-        json.dumps({"schema_version": "v1", "parameters": {"max_current": 35, "mode": 1}}),
-        encoding="utf-8",
-    )
-    report_dir = tmp_path / "reports"
+@pytest.mark.slow
+def test_cli_flash_verify_error_returns_nonzero_and_report(
+    capsys, fake_session_factory, valid_flash_config: Path
+) -> None:
+    fake = fake_session_factory(verify_error=True)
+    sink = InMemoryReportSink()
     code = main(
         [
             "flash",
@@ -258,55 +308,48 @@ def test_cli_flash_verify_error_returns_nonzero_and_report(tmp_path: Path, capsy
             "--address",
             "0x80",
             "--config",
-            str(config_path),
+            str(valid_flash_config),
             "--verify",
-            "--report-dir",
-            str(report_dir),
         ],
         session_factory=lambda _address: fake,
+        report_sink=sink,
     )
     output = capsys.readouterr()
     assert code == 16
     err = json.loads(output.err)
     assert err["code"] == "verification_failed"
-    report_file = Path(json.loads(output.out)["report"])
-    payload = json.loads(report_file.read_text(encoding="utf-8"))
+    assert Path(json.loads(output.out)["report"]) in sink.reports
+    payload = sink.only_report()
     assert payload["write_nvm_result"] == "ok"
     assert payload["verification_result"] == "error"
 
 
 @pytest.mark.integration
-def test_cli_flash_invalid_config_emits_error_report(tmp_path: Path, capsys) -> None:
-    fake = FakeSession()
+@pytest.mark.slow
+def test_cli_flash_invalid_config_emits_error_report(tmp_path: Path, capsys, fake_session_factory) -> None:
+    fake = fake_session_factory()
     config_path = tmp_path / "bad.json"
     config_path.write_text(json.dumps({"schema_version": "v99", "parameters": {}}), encoding="utf-8")
-    report_dir = tmp_path / "reports"
+    sink = InMemoryReportSink()
     code = main(
-        [
-            "flash",
-            "--port",
-            "/dev/ttyACM0",
-            "--config",
-            str(config_path),
-            "--report-dir",
-            str(report_dir),
-        ],
+        ["flash", "--port", "/dev/ttyACM0", "--config", str(config_path)],
         session_factory=lambda _address: fake,
+        report_sink=sink,
     )
     output = capsys.readouterr()
     assert code == 2
     err = json.loads(output.err)
     assert err["code"] == "invalid_input"
-    report_files = list(report_dir.glob("*flash*.json"))
-    assert len(report_files) == 1
+    assert sink.reports[Path(err["details"]["report"])]["write_nvm_result"] == "error"
 
 
 @pytest.mark.integration
-def test_cli_test_writes_json_and_optional_csv(tmp_path: Path, capsys) -> None:
-    fake = FakeSession()
+@pytest.mark.slow
+def test_cli_test_writes_json_and_optional_csv(tmp_path: Path, fake_session_factory) -> None:
+    fake = fake_session_factory()
     report_dir = tmp_path / "reports"
 
-    code = main(
+    result = run(
         [
             "test",
             "--port",
@@ -319,10 +362,9 @@ def test_cli_test_writes_json_and_optional_csv(tmp_path: Path, capsys) -> None:
         ],
         session_factory=lambda _address: fake,
     )
-    output = capsys.readouterr()
-    assert code == 0
-    result = json.loads(output.out)
-    report_path = Path(result["report"])
+    assert result.exit_code == 0
+    assert result.output is not None
+    report_path = Path(result.output["report"])
     assert report_path.exists()
     report_payload = json.loads(report_path.read_text(encoding="utf-8"))
     required_keys = {
@@ -345,51 +387,37 @@ def test_cli_test_writes_json_and_optional_csv(tmp_path: Path, capsys) -> None:
 
 
 @pytest.mark.integration
-def test_cli_test_mode_mismatch_returns_typed_code_and_report(tmp_path: Path, capsys) -> None:
-    fake = FakeSession(motion_enabled=False)
-    report_dir = tmp_path / "reports"
+@pytest.mark.slow
+def test_cli_test_mode_mismatch_returns_typed_code_and_report(capsys, fake_session_factory) -> None:
+    fake = fake_session_factory(motion_enabled=False)
+    sink = InMemoryReportSink()
     code = main(
-        [
-            "test",
-            "--port",
-            "/dev/ttyACM0",
-            "--recipe",
-            "smoke_v1",
-            "--report-dir",
-            str(report_dir),
-        ],
+        ["test", "--port", "/dev/ttyACM0", "--recipe", "smoke_v1"],
         session_factory=lambda _address: fake,
+        report_sink=sink,
     )
     output = capsys.readouterr()
     assert code == 13
     err_payload = json.loads(output.err)
     assert err_payload["code"] == "mode_mismatch"
-    report_files = list(report_dir.glob("*test*.json"))
-    assert len(report_files) == 1
+    assert sink.reports[Path(err_payload["details"]["report"])]["reason"] == "mode_mismatch"
 
 
 @pytest.mark.integration
-def test_cli_test_invalid_recipe_returns_invalid_input_report(tmp_path: Path, capsys) -> None:
-    fake = FakeSession()
-    report_dir = tmp_path / "reports"
+@pytest.mark.slow
+def test_cli_test_invalid_recipe_returns_invalid_input_report(capsys, fake_session_factory) -> None:
+    fake = fake_session_factory()
+    sink = InMemoryReportSink()
     code = main(
-        [
-            "test",
-            "--port",
-            "/dev/ttyACM0",
-            "--recipe",
-            "nope",
-            "--report-dir",
-            str(report_dir),
-        ],
+        ["test", "--port", "/dev/ttyACM0", "--recipe", "nope"],
         session_factory=lambda _address: fake,
+        report_sink=sink,
     )
     output = capsys.readouterr()
     assert code == 2
     err_payload = json.loads(output.err)
     assert err_payload["code"] == "invalid_input"
-    report_files = list(report_dir.glob("*test*.json"))
-    assert len(report_files) == 1
+    assert sink.reports[Path(err_payload["details"]["report"])]["reason"] == "invalid_input"
 
 
 @pytest.mark.integration
@@ -404,7 +432,7 @@ def test_cli_help_contains_examples(capsys) -> None:
 
 
 @pytest.mark.integration
-def test_cli_default_session_uses_basicmicro_transport_builder(monkeypatch, capsys) -> None:
+def test_cli_default_session_uses_basicmicro_transport_builder(monkeypatch, capsys, cli_mod) -> None:
     sentinel_transport = object()
 
     class FakeSessionForDefault:
@@ -421,8 +449,8 @@ def test_cli_default_session_uses_basicmicro_transport_builder(monkeypatch, caps
         def disconnect(self) -> None:
             return
 
-    monkeypatch.setattr(cli_module, "build_basicmicro_transport_from_env", lambda: sentinel_transport)
-    monkeypatch.setattr(cli_module, "RoboClawSession", FakeSessionForDefault)
+    monkeypatch.setattr(cli_mod, "build_basicmicro_transport_from_env", lambda: sentinel_transport)
+    monkeypatch.setattr(cli_mod, "RoboClawSession", FakeSessionForDefault)
 
     code = main(["info", "--port", "/dev/ttyACM0"])
     output = capsys.readouterr()
@@ -14,3 +14,4 @@ def test_cli_command_surface_matches_mvp_scope() -> None:
     assert len(subparsers_actions) == 1
     choices = set(subparsers_actions[0].choices.keys())
     assert choices == {"list", "info", "dump", "flash", "test"}
+    assert _build_parser() is parser
@@ -1,17 +1,13 @@
 from __future__ import annotations
 
+import motion_studio_linux.device_manager as device_manager_module
 from motion_studio_linux.device_manager import DeviceManager
 
 
-def test_list_ports_is_deterministic_and_unique(monkeypatch) -> None:
-    manager = DeviceManager()
-
-    def fake_glob(pattern: str) -> list[str]:
-        if "ACM" in pattern:
-            return ["/dev/ttyACM1", "/dev/ttyACM0", "/dev/ttyACM0"]
-        return ["/dev/ttyUSB2", "/dev/ttyUSB1"]
-
-    monkeypatch.setattr("motion_studio_linux.device_manager.glob", fake_glob)
+def test_list_ports_is_deterministic_and_unique() -> None:
+    manager = DeviceManager(
+        iter_candidates=lambda: ["/dev/ttyACM1", "/dev/ttyACM0", "/dev/ttyACM0", "/dev/ttyUSB2", "/dev/ttyUSB1"]
+    )
 
     ports = manager.list_ports()
 
@@ -21,3 +17,25 @@ def test_list_ports_is_deterministic_and_unique(monkeypatch) -> None:
         "/dev/ttyUSB1",
         "/dev/ttyUSB2",
     ]
+
+
+def test_iter_candidates_filters_dev_entries_by_prefix(tmp_path, monkeypatch) -> None:
+    for name in ("ttyACM0", "ttyUSB3", "ttyS0", "null"):
+        (tmp_path / name).touch()
+    monkeypatch.setattr(device_manager_module, "DEV_DIR", str(tmp_path))
+
+    assert sorted(device_manager_module.iter_candidates()) == [f"{tmp_path}/ttyACM0", f"{tmp_path}/ttyUSB3"]
+
+
+def test_iter_candidates_tolerates_missing_dev_dir(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(device_manager_module, "DEV_DIR", str(tmp_path / "missing"))
+
+    assert DeviceManager().list_ports() == []
+
+
+def test_iter_candidates_tolerates_unlistable_dev_dir(tmp_path, monkeypatch) -> None:
+    not_a_dir = tmp_path / "dev"
+    not_a_dir.touch()
+    monkeypatch.setattr(device_manager_module, "DEV_DIR", str(not_a_dir))
+
+    assert DeviceManager().list_ports() == []
@@ -1,32 +1,43 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any
+
 import pytest
 
 from motion_studio_linux.errors import OperationTimeoutError
-from motion_studio_linux.flasher import Flasher
+from motion_studio_linux.flasher import NVM_WRITE_KEY, Flasher
 from motion_studio_linux.models import ConfigPayload
 
+_NVM_KEY_CALL = f"write_nvm:{hex(NVM_WRITE_KEY)}"
+
 
 class FakeSession:
-    def __init__(
+    def __init__(self, **overrides: Any) -> None:
+        self.reset(**overrides)
+
+    def reset(
         self,
         *,
         readback: dict[str, int] | None = None,
         reload_failures_before_success: int = 0,
-    ) -> None:
+    ) -> FakeSession:
         self.calls: list[str] = []
-        self._readback = readback if readback is not None else {"max_current": 35, "mode": 1}
+        self._readback = MappingProxyType(readback if readback is not None else {"max_current": 35, "mode": 1})
         self._reload_failures_before_success = reload_failures_before_success
+        return self
 
     def get_firmware(self) -> str:
         self.calls.append("get_firmware")
         return "v4.4.1"
 
-    def apply_config(self, parameters: dict[str, int]) -> None:
+    def apply_config(self, parameters: Mapping[str, int]) -> None:
         self.calls.append(f"apply_config:{parameters}")
 
     def write_nvm(self, key: int) -> None:
-        self.calls.append(f"write_nvm:{hex(key)}")
+        assert key == NVM_WRITE_KEY
+        self.calls.append(_NVM_KEY_CALL)
 
     def reload_from_nvm(self) -> None:
         self.calls.append("reload_from_nvm")
@@ -40,14 +51,14 @@ class FakeSession:
     def disconnect(self) -> None:
         self.calls.append("disconnect")
 
-    def dump_config(self) -> dict[str, int]:
+    def dump_config(self) -> Mapping[str, int]:
         self.calls.append("dump_config")
         return self._readback
 
 
 @pytest.mark.unit
-def test_flash_enforces_apply_write_verify_sequence() -> None:
-    session = FakeSession()
+def test_flash_enforces_apply_write_verify_sequence(fake_session_factory: Callable[..., FakeSession]) -> None:
+    session = fake_session_factory()
     flasher = Flasher(session)  # type: ignore[arg-type]
     config = ConfigPayload(schema_version="v1", parameters={"max_current": 35, "mode": 1})
 
@@ -65,8 +76,8 @@ def test_flash_enforces_apply_write_verify_sequence() -> None:
 
 
 @pytest.mark.unit
-def test_flash_verify_detects_mismatch() -> None:
-    session = FakeSession(readback={"max_current": 99, "mode": 1})
+def test_flash_verify_detects_mismatch(fake_session_factory: Callable[..., FakeSession]) -> None:
+    session = fake_session_factory(readback={"max_current": 99, "mode": 1})
     flasher = Flasher(session)  # type: ignore[arg-type]
     config = ConfigPayload(schema_version="v1", parameters={"max_current": 35, "mode": 1})
 
@@ -76,8 +87,8 @@ def test_flash_verify_detects_mismatch() -> None:
 
 
 @pytest.mark.unit
-def test_flash_without_verify_skips_reload() -> None:
-    session = FakeSession()
+def test_flash_without_verify_skips_reload(fake_session_factory: Callable[..., FakeSession]) -> None:
+    session = fake_session_factory()
     flasher = Flasher(session)  # type: ignore[arg-type]
     config = ConfigPayload(schema_version="v1", parameters={"max_current": 35, "mode": 1})
 
@@ -88,8 +99,8 @@ def test_flash_without_verify_skips_reload() -> None:
 
 
 @pytest.mark.unit
-def test_flash_verify_uses_subset_compare() -> None:
-    session = FakeSession(readback={"max_current": 35, "mode": 1, "max_current_m1": 35, "max_current_m2": 35})
+def test_flash_verify_uses_subset_compare(fake_session_factory: Callable[..., FakeSession]) -> None:
+    session = fake_session_factory(readback={"max_current": 35, "mode": 1, "max_current_m1": 35, "max_current_m2": 35})
     flasher = Flasher(session)  # type: ignore[arg-type]
     config = ConfigPayload(schema_version="v1", parameters={"max_current": 35})
 
@@ -99,8 +110,8 @@ def test_flash_verify_uses_subset_compare() -> None:
 
 
 @pytest.mark.unit
-def test_flash_verify_reconnects_and_recovers_after_timeout() -> None:
-    session = FakeSession(reload_failures_before_success=1)
+def test_flash_verify_reconnects_and_recovers_after_timeout(fake_session_factory: Callable[..., FakeSession]) -> None:
+    session = fake_session_factory(reload_failures_before_success=1)
     flasher = Flasher(session)  # type: ignore[arg-type]
     config = ConfigPayload(schema_version="v1", parameters={"max_current": 35, "mode": 1})
 
@@ -112,8 +123,8 @@ def test_flash_verify_reconnects_and_recovers_after_timeout() -> None:
 
 
 @pytest.mark.unit
-def test_flash_verify_returns_error_after_retry_failure() -> None:
-    session = FakeSession(reload_failures_before_success=2)
+def test_flash_verify_returns_error_after_retry_failure(fake_session_factory: Callable[..., FakeSession]) -> None:
+    session = fake_session_factory(reload_failures_before_success=2)
     flasher = Flasher(session)  # type: ignore[arg-type]
     config = ConfigPayload(schema_version="v1", parameters={"max_current": 35, "mode": 1})
 
@@ -1,131 +1,23 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Any
+from unittest.mock import NonCallableMagicMock
 
 import pytest
 
+from motion_studio_linux.device_manager import DeviceManager
 from motion_studio_linux.gui.desktop_controller import DesktopShellController
+from motion_studio_linux.gui.facade import ServiceGuiFacade
 
 
-class FakeFacade:
-    def __init__(self) -> None:
-        self.last_call: tuple[str, dict[str, Any]] | None = None
-
-    def list_devices(self) -> list[str]:
-        return ["/dev/ttyACM0", "/dev/ttyUSB0"]
-
-    def get_device_info(self, *, port: str, address: int) -> dict[str, object]:
-        self.last_call = ("info", {"port": port, "address": address})
-        return {"ok": True, "port": port, "address": f"0x{address:02X}", "firmware": "v4.4.3"}
-
-    def dump_config(self, *, port: str, address: int, out_path: str) -> dict[str, object]:
-        self.last_call = (
-            "dump",
-            {"port": port, "address": address, "out_path": out_path},
-        )
-        return {"ok": True, "out_path": out_path, "config_hash": "abc"}
-
-    def flash_config(
-        self,
-        *,
-        port: str,
-        address: int,
-        config_path: str,
-        verify: bool,
-        report_dir: str,
-    ) -> dict[str, object]:
-        self.last_call = (
-            "flash",
-            {
-                "port": port,
-                "address": address,
-                "config_path": config_path,
-                "verify": verify,
-                "report_dir": report_dir,
-            },
-        )
-        return {
-            "ok": True,
-            "report": f"{report_dir}/flash.json",
-            "write_nvm_result": "ok",
-            "verification_result": "pass" if verify else "skipped",
-        }
-
-    def run_test(
-        self,
-        *,
-        port: str,
-        address: int,
-        recipe: str,
-        report_dir: str,
-        csv: bool,
-    ) -> dict[str, object]:
-        self.last_call = (
-            "test",
-            {
-                "port": port,
-                "address": address,
-                "recipe": recipe,
-                "report_dir": report_dir,
-                "csv": csv,
-            },
-        )
-        return {
-            "ok": True,
-            "report": f"{report_dir}/test.json",
-            "passed": True,
-            "reason": "completed",
-        }
-
-    def get_live_status(self, *, port: str, address: int) -> dict[str, object]:
-        self.last_call = ("status", {"port": port, "address": address})
-        return {
-            "ok": True,
-            "port": port,
-            "address": f"0x{address:02X}",
-            "firmware": "v4.4.3",
-            "telemetry": {"battery_voltage": 480, "error_bits": 0},
-        }
-
-    def run_pwm_pulse(
-        self,
-        *,
-        port: str,
-        address: int,
-        duty_m1: int,
-        duty_m2: int,
-        runtime_s: float,
-    ) -> dict[str, object]:
-        self.last_call = (
-            "pwm_pulse",
-            {
-                "port": port,
-                "address": address,
-                "duty_m1": duty_m1,
-                "duty_m2": duty_m2,
-                "runtime_s": runtime_s,
-            },
-        )
-        return {
-            "ok": True,
-            "port": port,
-            "address": f"0x{address:02X}",
-            "duty_m1": duty_m1,
-            "duty_m2": duty_m2,
-            "runtime_s": runtime_s,
-            "telemetry": {"battery_voltage": 480, "error_bits": 0},
-        }
-
-    def stop_all(self, *, port: str, address: int) -> dict[str, object]:
-        self.last_call = ("stop_all", {"port": port, "address": address})
-        return {"ok": True, "port": port, "address": f"0x{address:02X}", "stopped": True}
+@pytest.fixture
+def controller(fake_facade: NonCallableMagicMock) -> DesktopShellController:
+    return DesktopShellController(fake_facade)
 
 
 @pytest.mark.unit
-def test_controller_refresh_and_select_target() -> None:
-    controller = DesktopShellController(FakeFacade())
-
+def test_controller_refresh_and_select_target(controller: DesktopShellController) -> None:
     ports = controller.refresh_ports()
     assert ports == ("/dev/ttyACM0", "/dev/ttyUSB0")
     assert controller.state.available_ports == ports
@@ -138,9 +30,28 @@ def test_controller_refresh_and_select_target() -> None:
 
 
 @pytest.mark.unit
-def test_controller_select_target_validates_port_and_address() -> None:
-    controller = DesktopShellController(FakeFacade())
+def test_controller_user_refresh_rescans_inside_cache_ttl() -> None:
+    plugged = ["/dev/ttyACM0"]
+    scans: list[int] = []
 
+    def iter_candidates() -> list[str]:
+        scans.append(1)
+        return list(plugged)
+
+    facade = ServiceGuiFacade(device_manager=DeviceManager(iter_candidates=iter_candidates), ports_ttl_s=60.0)
+    controller = DesktopShellController(facade)
+    assert controller.refresh_ports() == ("/dev/ttyACM0",)
+
+    plugged.append("/dev/ttyUSB0")
+    # Startup/poll refreshes may reuse the cached scan; the Refresh button must not.
+    assert controller.refresh_ports() == ("/dev/ttyACM0",)
+    assert controller.refresh_ports(rescan=True) == ("/dev/ttyACM0", "/dev/ttyUSB0")
+    assert controller.state.available_ports == ("/dev/ttyACM0", "/dev/ttyUSB0")
+    assert len(scans) == 2
+
+
+@pytest.mark.unit
+def test_controller_select_target_validates_port_and_address(controller: DesktopShellController) -> None:
     with pytest.raises(ValueError):
         controller.select_target(port="", address_raw="0x80")
 
@@ -149,9 +60,7 @@ def test_controller_select_target_validates_port_and_address() -> None:
 
 
 @pytest.mark.unit
-def test_controller_marks_success_and_failure_job_states() -> None:
-    controller = DesktopShellController(FakeFacade())
-
+def test_controller_marks_success_and_failure_job_states(controller: DesktopShellController) -> None:
     controller.mark_job_started(command="flash", message="Running flash")
     summary = controller.mark_job_result(
         command="flash",
@@ -193,19 +102,16 @@ def test_controller_marks_success_and_failure_job_states() -> None:
 
 
 @pytest.mark.unit
-def test_controller_invokes_facade_commands() -> None:
-    facade = FakeFacade()
-    controller = DesktopShellController(facade)
-
+def test_controller_invokes_facade_commands(
+    controller: DesktopShellController, fake_facade: NonCallableMagicMock
+) -> None:
     info = controller.run_info(port="/dev/ttyACM0", address=0x80)
     assert info["ok"] is True
-    assert facade.last_call is not None
-    assert facade.last_call[0] == "info"
+    fake_facade.get_device_info.assert_called_once_with(port="/dev/ttyACM0", address=0x80)
 
     dumped = controller.run_dump(port="/dev/ttyACM0", address=0x80, out_path="config.json")
     assert dumped["ok"] is True
-    assert facade.last_call is not None
-    assert facade.last_call[0] == "dump"
+    fake_facade.dump_config.assert_called_once_with(port="/dev/ttyACM0", address=0x80, out_path="config.json")
 
     flashed = controller.run_flash(
         port="/dev/ttyACM0",
@@ -215,8 +121,13 @@ def test_controller_invokes_facade_commands() -> None:
         report_dir="reports",
     )
     assert flashed["ok"] is True
-    assert facade.last_call is not None
-    assert facade.last_call[0] == "flash"
+    fake_facade.flash_config.assert_called_once_with(
+        port="/dev/ttyACM0",
+        address=0x80,
+        config_path="cfg.json",
+        verify=True,
+        report_dir="reports",
+    )
 
     tested = controller.run_test(
         port="/dev/ttyACM0",
@@ -226,13 +137,17 @@ def test_controller_invokes_facade_commands() -> None:
         csv=True,
     )
     assert tested["ok"] is True
-    assert facade.last_call is not None
-    assert facade.last_call[0] == "test"
+    fake_facade.run_test.assert_called_once_with(
+        port="/dev/ttyACM0",
+        address=0x80,
+        recipe="smoke_v1",
+        report_dir="reports",
+        csv=True,
+    )
 
     status = controller.run_status(port="/dev/ttyACM0", address=0x80)
     assert status["ok"] is True
-    assert facade.last_call is not None
-    assert facade.last_call[0] == "status"
+    fake_facade.get_live_status.assert_called_once_with(port="/dev/ttyACM0", address=0x80)
 
     pulse = controller.run_pwm_pulse(
         port="/dev/ttyACM0",
@@ -242,23 +157,27 @@ def test_controller_invokes_facade_commands() -> None:
         runtime_s=0.25,
     )
     assert pulse["ok"] is True
-    assert facade.last_call is not None
-    assert facade.last_call[0] == "pwm_pulse"
+    fake_facade.run_pwm_pulse.assert_called_once_with(
+        port="/dev/ttyACM0",
+        address=0x80,
+        duty_m1=20,
+        duty_m2=20,
+        runtime_s=0.25,
+    )
 
     stop = controller.run_stop_all(port="/dev/ttyACM0", address=0x80)
     assert stop["ok"] is True
-    assert facade.last_call is not None
-    assert facade.last_call[0] == "stop_all"
+    fake_facade.stop_all.assert_called_once_with(port="/dev/ttyACM0", address=0x80)
 
 
 @pytest.mark.unit
-def test_controller_report_helpers(tmp_path: Path) -> None:
-    controller = DesktopShellController(FakeFacade())
+def test_controller_report_helpers(tmp_path: Path, controller: DesktopShellController) -> None:
     report = tmp_path / "report.json"
     report.write_text('{"ok": true}', encoding="utf-8")
 
     reports = controller.list_reports(report_dir=tmp_path)
     assert reports == [report]
+    assert controller.list_reports(report_dir=os.fspath(tmp_path)) == [report]
 
     preview = controller.read_report_preview(path=report)
     assert '"ok": true' in preview
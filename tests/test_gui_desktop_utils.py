@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -36,14 +37,44 @@ def test_list_report_files_sorted_by_mtime_desc(tmp_path: Path) -> None:
     assert files == [newer, older]
 
 
+@pytest.mark.unit
+def test_list_report_files_skips_reports_removed_during_scan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    kept = tmp_path / "kept.json"
+    rotated = tmp_path / "rotated.json"
+    kept.write_text("{}", encoding="utf-8")
+    rotated.write_text("{}", encoding="utf-8")
+    real_scandir = os.scandir
+
+    class _RotatingScandir:
+        # Read the directory, then delete one report before list_report_files stats it.
+        def __init__(self, path: str) -> None:
+            with real_scandir(path) as it:
+                self._entries = list(it)
+            rotated.unlink()
+
+        def __enter__(self) -> _RotatingScandir:
+            return self
+
+        def __exit__(self, *_exc: object) -> None:
+            return None
+
+        def __iter__(self) -> Iterator[os.DirEntry[str]]:
+            return iter(self._entries)
+
+    monkeypatch.setattr(os, "scandir", _RotatingScandir)
+    assert list_report_files(tmp_path) == [kept]
+
+
 @pytest.mark.unit
 def test_read_preview_text_truncates_large_files(tmp_path: Path) -> None:
     path = tmp_path / "report.txt"
     path.write_text("x" * 50, encoding="utf-8")
 
     text = read_preview_text(path, max_chars=10)
-    assert text.startswith("x" * 10)
-    assert "[truncated]" in text
+    assert text == "x" * 10 + "\n...\n[truncated]"
+    assert read_preview_text(path, max_chars=50) == "x" * 50
 
 
 @pytest.mark.unit
@@ -75,6 +75,31 @@ def test_facade_list_and_info_paths() -> None:
     assert info["firmware"] == "v4.4.3"
 
 
+@pytest.mark.unit
+def test_facade_list_devices_caches_scan_within_ttl() -> None:
+    class CountingDeviceManager(FakeDeviceManager):
+        scans = 0
+
+        def list_ports(self) -> list[str]:
+            self.scans += 1
+            return super().list_ports()
+
+    manager = CountingDeviceManager()
+    facade = ServiceGuiFacade(device_manager=manager)  # type: ignore[arg-type]
+
+    assert facade.list_devices() == ["/dev/ttyACM0", "/dev/ttyUSB1"]
+    assert facade.list_devices() == ["/dev/ttyACM0", "/dev/ttyUSB1"]
+    assert manager.scans == 1
+
+    facade.list_devices(bypass_cache=True)
+    assert manager.scans == 2
+
+    uncached = ServiceGuiFacade(device_manager=manager, ports_ttl_s=0)  # type: ignore[arg-type]
+    uncached.list_devices()
+    uncached.list_devices()
+    assert manager.scans == 4
+
+
 @pytest.mark.unit
 def test_facade_dump_writes_file(tmp_path: Path) -> None:
     session = FakeSession()
@@ -146,6 +171,30 @@ def test_facade_flash_mismatch_returns_error_payload(tmp_path: Path) -> None:
     assert err["code"] == "verification_mismatch"
 
 
+@pytest.mark.unit
+def test_facade_flash_without_verify_skips_readback(tmp_path: Path) -> None:
+    # A mismatching readback would fail the flash, so ok=True proves dump_config was never consulted.
+    session = FakeSession(verify_mismatch=True)
+    facade = ServiceGuiFacade(session_factory=lambda _address: session)  # type: ignore[arg-type]
+
+    config_path = tmp_path / "cfg.json"
+    config_path.write_text(
+        json.dumps({"schema_version": "v1", "parameters": {"max_current": 35, "mode": 3}}),
+        encoding="utf-8",
+    )
+
+    result = facade.flash_config(
+        port="/dev/ttyACM0",
+        address=0x80,
+        config_path=str(config_path),
+        verify=False,
+        report_dir=str(tmp_path / "reports"),
+    )
+    assert result["ok"] is True
+    assert result["verification_result"] is None
+    assert session.reload_calls == 0
+
+
 @pytest.mark.unit
 def test_facade_live_status_reads_firmware_and_telemetry() -> None:
     session = FakeSession()
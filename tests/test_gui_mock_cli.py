@@ -1,117 +1,61 @@
 from __future__ import annotations
 
-import json
+import io
+from contextlib import redirect_stdout
+from unittest.mock import NonCallableMagicMock
 
 import pytest
 
-from motion_studio_linux.gui.mock_cli import main
+from motion_studio_linux.gui.mock_cli import _build_parser, _selected_command, main, run
 
 
-class FakeFacade:
-    def list_devices(self) -> list[str]:
-        return ["/dev/ttyACM0"]
-
-    def get_device_info(self, *, port: str, address: int) -> dict[str, object]:
-        del port, address
-        return {"ok": True, "firmware": "v4.4.3", "port": "/dev/ttyACM0", "address": "0x80"}
-
-    def dump_config(self, *, port: str, address: int, out_path: str) -> dict[str, object]:
-        del port, address
-        return {"ok": True, "out_path": out_path}
-
-    def flash_config(
-        self, *, port: str, address: int, config_path: str, verify: bool, report_dir: str
-    ) -> dict[str, object]:
-        del port, address, config_path, verify, report_dir
-        return {"ok": True, "report": "reports/mock_flash.json", "write_nvm_result": "ok", "verification_result": "pass"}
-
-    def run_test(
-        self, *, port: str, address: int, recipe: str, report_dir: str, csv: bool
-    ) -> dict[str, object]:
-        del port, address, recipe, report_dir, csv
-        return {"ok": True, "report": "reports/mock_test.json", "passed": True, "reason": "completed"}
-
-    def get_live_status(self, *, port: str, address: int) -> dict[str, object]:
-        del port, address
-        return {"ok": True, "firmware": "v4.4.3", "telemetry": {"battery_voltage": 480}}
-
-    def run_pwm_pulse(
-        self, *, port: str, address: int, duty_m1: int, duty_m2: int, runtime_s: float
-    ) -> dict[str, object]:
-        del port, address, duty_m1, duty_m2, runtime_s
-        return {"ok": True, "telemetry": {"battery_voltage": 480}}
-
-    def stop_all(self, *, port: str, address: int) -> dict[str, object]:
-        del port, address
-        return {"ok": True, "stopped": True}
+_TARGET = ["--port", "/dev/ttyACM0", "--address", "0x80"]
 
 
 @pytest.mark.integration
-def test_mock_cli_list_and_info(capsys) -> None:
-    code_list = main(["list"], facade=FakeFacade())  # type: ignore[arg-type]
-    out_list = json.loads(capsys.readouterr().out)
-    assert code_list == 0
-    assert out_list["ports"] == ["/dev/ttyACM0"]
-
-    code_info = main(["info", "--port", "/dev/ttyACM0", "--address", "0x80"], facade=FakeFacade())  # type: ignore[arg-type]
-    out_info = json.loads(capsys.readouterr().out)
-    assert code_info == 0
-    assert out_info["state"] == "success"
-
+def test_mock_cli_list(capsys, fake_facade: NonCallableMagicMock) -> None:
+    fake_facade.list_devices.return_value = ["/dev/ttyACM0"]
+    code = main(["list"], facade=fake_facade)
+    assert code == 0
+    assert capsys.readouterr().out == '{"ports": ["/dev/ttyACM0"]}\n'
 
-@pytest.mark.integration
-def test_mock_cli_flash_and_test(capsys) -> None:
-    code_flash = main(
-        ["flash", "--port", "/dev/ttyACM0", "--address", "0x80", "--config", "cfg.json"],
-        facade=FakeFacade(),  # type: ignore[arg-type]
-    )
-    out_flash = json.loads(capsys.readouterr().out)
-    assert code_flash == 0
-    assert out_flash["state"] == "success"
 
-    code_test = main(
-        ["test", "--port", "/dev/ttyACM0", "--address", "0x80", "--recipe", "smoke_v1"],
-        facade=FakeFacade(),  # type: ignore[arg-type]
-    )
-    out_test = json.loads(capsys.readouterr().out)
-    assert code_test == 0
-    assert out_test["state"] == "success"
+@pytest.mark.unit
+def test_mock_cli_output_is_ascii_json_lines_on_text_only_streams(fake_facade: NonCallableMagicMock) -> None:
+    # Wire format is json.dumps(..., sort_keys=True): default separators, non-ASCII escaped.
+    fake_facade.list_devices.return_value = ["/dev/ttyACM0", "/dev/tty\u00e9"]
+    stream = io.StringIO()
+    with redirect_stdout(stream):
+        code = main(["list"], facade=fake_facade)
+    assert code == 0
+    assert stream.getvalue() == '{"ports": ["/dev/ttyACM0", "/dev/tty\\u00e9"]}\n'
 
 
 @pytest.mark.integration
-def test_mock_cli_status_pwm_and_stop(capsys) -> None:
-    code_status = main(
-        ["status", "--port", "/dev/ttyACM0", "--address", "0x80"],
-        facade=FakeFacade(),  # type: ignore[arg-type]
-    )
-    out_status = json.loads(capsys.readouterr().out)
-    assert code_status == 0
-    assert out_status["state"] == "success"
-
-    code_pwm = main(
-        [
-            "pwm",
-            "--port",
-            "/dev/ttyACM0",
-            "--address",
-            "0x80",
-            "--duty-m1",
-            "10",
-            "--duty-m2",
-            "-10",
-            "--runtime-s",
-            "0.05",
-        ],
-        facade=FakeFacade(),  # type: ignore[arg-type]
-    )
-    out_pwm = json.loads(capsys.readouterr().out)
-    assert code_pwm == 0
-    assert out_pwm["state"] == "success"
-
-    code_stop = main(
-        ["stop", "--port", "/dev/ttyACM0", "--address", "0x80"],
-        facade=FakeFacade(),  # type: ignore[arg-type]
-    )
-    out_stop = json.loads(capsys.readouterr().out)
-    assert code_stop == 0
-    assert out_stop["state"] == "success"
+@pytest.mark.parametrize(
+    "argv",
+    [
+        pytest.param(["info", *_TARGET], id="info"),
+        pytest.param(["flash", *_TARGET, "--config", "cfg.json"], id="flash"),
+        pytest.param(["test", *_TARGET, "--recipe", "smoke_v1"], id="test"),
+        pytest.param(["status", *_TARGET], id="status"),
+        pytest.param(
+            ["pwm", *_TARGET, "--duty-m1", "10", "--duty-m2", "-10", "--runtime-s", "0.05"],
+            id="pwm",
+        ),
+        pytest.param(["stop", *_TARGET], id="stop"),
+    ],
+)
+def test_mock_cli_target_command_succeeds(fake_facade: NonCallableMagicMock, argv: list[str]) -> None:
+    # run() hands back the payload main() would print, so there is no JSON round trip to check it.
+    code, out = run(argv, facade=fake_facade)
+    assert code == 0
+    assert out is not None
+    assert out["state"] == "success"
+
+
+@pytest.mark.unit
+def test_mock_cli_parsers_are_built_once_per_command() -> None:
+    assert _build_parser("status") is _build_parser("status")
+    assert _selected_command(["bogus"]) is None
+    assert _selected_command(["--help"]) is None
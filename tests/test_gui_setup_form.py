@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
 
 from motion_studio_linux.gui.setup_form import (
@@ -10,54 +12,47 @@ from motion_studio_linux.gui.setup_form import (
 )
 
 
-@pytest.mark.unit
-def test_model_from_config_payload_reads_schema_or_parameters_root() -> None:
-    payload = {
-        "schema_version": "v1",
-        "parameters": {
-            "mode": 3,
-            "max_current": 12000,
+_UNIFIED = SetupFormModel(mode=3, use_unified_current=True, max_current=12000)
+_SPLIT = SetupFormModel(mode=0, use_unified_current=False, max_current_m1=10000, max_current_m2=11000)
+
+# (payload, model, extras): payload -> model, model -> payload minus extras, and the extras reported.
+_ROUND_TRIP_CASES = [
+    pytest.param(
+        {"schema_version": "v1", "parameters": {"mode": 3, "max_current": 12000}},
+        _UNIFIED,
+        [],
+        id="unified",
+    ),
+    pytest.param(
+        {"schema_version": "v1", "parameters": {"mode": 0, "max_current_m1": 10000, "max_current_m2": 11000}},
+        _SPLIT,
+        [],
+        id="split",
+    ),
+    pytest.param(
+        {
+            "schema_version": "v1",
+            "parameters": {"mode": 3, "max_current": 12000, "rc_mode": 1, "battery_cutoff": 100},
         },
-    }
-    model = model_from_config_payload(payload)
-    assert model.mode == 3
-    assert model.use_unified_current is True
-    assert model.max_current == 12000
-
-    params_only = {"mode": 0, "max_current_m1": 10000, "max_current_m2": 11000}
-    model_params_only = model_from_config_payload(params_only)
-    assert model_params_only.mode == 0
-    assert model_params_only.use_unified_current is False
-    assert model_params_only.max_current_m1 == 10000
-    assert model_params_only.max_current_m2 == 11000
+        _UNIFIED,
+        ["battery_cutoff", "rc_mode"],
+        id="extras",
+    ),
+]
 
 
 @pytest.mark.unit
-def test_config_payload_from_model_handles_unified_and_split_currents() -> None:
-    unified = SetupFormModel(mode=3, use_unified_current=True, max_current=12000)
-    unified_payload = config_payload_from_model(unified)
-    assert unified_payload == {
-        "schema_version": "v1",
-        "parameters": {"mode": 3, "max_current": 12000},
-    }
-
-    split = SetupFormModel(mode=0, use_unified_current=False, max_current_m1=10000, max_current_m2=11000)
-    split_payload = config_payload_from_model(split)
-    assert split_payload == {
-        "schema_version": "v1",
-        "parameters": {"mode": 0, "max_current_m1": 10000, "max_current_m2": 11000},
-    }
+@pytest.mark.parametrize("payload, model, extras", _ROUND_TRIP_CASES)
+def test_setup_form_round_trips_config_payload(
+    payload: dict[str, Any], model: SetupFormModel, extras: list[str]
+) -> None:
+    assert model_from_config_payload(payload) == model
+    supported = {key: value for key, value in payload["parameters"].items() if key not in extras}
+    assert config_payload_from_model(model) == {"schema_version": "v1", "parameters": supported}
+    assert unsupported_parameter_keys(payload) == extras
 
 
 @pytest.mark.unit
-def test_unsupported_parameter_keys_reports_extra_fields() -> None:
-    payload = {
-        "schema_version": "v1",
-        "parameters": {
-            "mode": 3,
-            "max_current": 12000,
-            "rc_mode": 1,
-            "battery_cutoff": 100,
-        },
-    }
-    assert unsupported_parameter_keys(payload) == ["battery_cutoff", "rc_mode"]
+def test_model_from_config_payload_accepts_parameters_root() -> None:
+    params_only = {"mode": 0, "max_current_m1": 10000, "max_current_m2": 11000}
+    assert model_from_config_payload(params_only) == _SPLIT
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-import json
+import importlib.util
+import re
+import sys
+import time
+from datetime import datetime
+from functools import partial
+from pathlib import Path
 
 import pytest
 
+from motion_studio_linux import models
 from motion_studio_linux.errors import MotionStudioError, SafetyAbortError
-from motion_studio_linux.models import ConfigPayload, DeviceTarget
+from motion_studio_linux.models import ConfigPayload, DeviceTarget, utc_timestamp, utc_timestamp_compact
+from motion_studio_linux.reporting import artifact_path
 
 
 @pytest.mark.unit
@@ -21,14 +29,60 @@ def test_config_payload_hash_is_deterministic_for_key_order() -> None:
     assert payload_a.config_hash == payload_b.config_hash
 
 
+@pytest.mark.unit
+def test_config_payload_parameters_are_read_only_snapshot() -> None:
+    source = {"a": 1}
+    payload = ConfigPayload(schema_version="v1", parameters=source)
+    first = payload.config_hash
+    source["a"] = 2
+    with pytest.raises(TypeError):
+        payload.parameters["a"] = 3  # type: ignore[index]
+    assert payload.parameters == {"a": 1}
+    assert payload.config_hash == first
+
+
+@pytest.mark.unit
+def test_config_payload_hash_does_not_depend_on_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Floats and non-ASCII text encode differently under orjson; the hash must stay on stdlib json.
+    parameters = {"a": 1e16, "n": "\u00e9", "b": 0.1}
+    expected = "30cf87f1aa5fb918be304c2350721604e38304c2d5929a20bdb8341ac3a46354"
+    assert ConfigPayload(schema_version="v1", parameters=parameters).config_hash == expected
+
+    # Load a private copy of models with orjson unimportable, leaving the shared module untouched.
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location("_models_without_orjson", models.__file__)
+    assert spec is not None and spec.loader is not None
+    fallback = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, fallback)
+    spec.loader.exec_module(fallback)
+    assert fallback.ConfigPayload(schema_version="v1", parameters=parameters).config_hash == expected
+
+
 @pytest.mark.unit
 def test_error_serialization_shape_is_stable() -> None:
     err: MotionStudioError = SafetyAbortError(
         "Current limit exceeded",
         details={"phase": "smoke_v1"},
     )
-    serialized = json.dumps(err.to_dict(), sort_keys=True)
-    assert serialized == (
-        '{"code": "safety_abort", "details": {"phase": "smoke_v1"}, '
-        '"message": "Current limit exceeded"}'
-    )
+    assert err.to_dict() == {
+        "code": "safety_abort",
+        "message": "Current limit exceeded",
+        "details": {"phase": "smoke_v1"},
+    }
+
+
+@pytest.mark.unit
+def test_utc_timestamp_formats_match_isoformat_and_artifact_names(monkeypatch: pytest.MonkeyPatch) -> None:
+    stamp = utc_timestamp()
+    assert datetime.fromisoformat(stamp).isoformat() == stamp
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{6}Z", utc_timestamp_compact())
+
+    # With the clock pinned, the default (compact) artifact name matches the one built from utc_timestamp().
+    fixed = time.strptime("2026-02-12T16:00:00", "%Y-%m-%dT%H:%M:%S")
+    monkeypatch.setattr(time, "gmtime", lambda *_args: fixed)
+    assert utc_timestamp() == "2026-02-12T16:00:00+00:00"
+    assert utc_timestamp_compact() == "2026-02-12T160000Z"
+    flash_path = partial(artifact_path, report_dir=Path("reports"), kind="flash", port="/dev/ttyACM0", address=0x80)
+    default_name = flash_path().name
+    assert default_name == flash_path(timestamp=utc_timestamp()).name
+    assert default_name == "2026-02-12T160000Z_flash_ttyACM0_0x80.json"
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 
 import pytest
 
-from motion_studio_linux.reporting import artifact_path, write_csv_report, write_json_report
+from motion_studio_linux.reporting import (
+    artifact_path,
+    encode_json,
+    write_csv_report,
+    write_csv_stream,
+    write_json_report,
+    write_json_stream,
+)
 
 
 @pytest.mark.unit
@@ -21,12 +29,17 @@ def test_artifact_path_uses_stable_format() -> None:
 
 
 @pytest.mark.unit
-def test_write_json_report_is_sorted_and_pretty(tmp_path: Path) -> None:
-    path = tmp_path / "r.json"
+def test_write_json_stream_is_sorted_and_pretty() -> None:
+    buffer = io.BytesIO()
+    write_json_stream(buffer, {"b": 2, "a": 1})
+    assert buffer.getvalue() == b'{\n  "a": 1,\n  "b": 2\n}\n'
+
+
+@pytest.mark.unit
+def test_write_json_report_writes_sorted_pretty_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "report.json"
     write_json_report(path, {"b": 2, "a": 1})
-    assert path.read_text(encoding="utf-8") == '{\n  "a": 1,\n  "b": 2\n}\n'
-    parsed = json.loads(path.read_text(encoding="utf-8"))
-    assert parsed["a"] == 1
+    assert path.read_bytes() == b'{\n  "a": 1,\n  "b": 2\n}\n'
 
 
 @pytest.mark.unit
@@ -34,3 +47,43 @@ def test_write_csv_report_uses_sorted_header(tmp_path: Path) -> None:
     path = tmp_path / "t.csv"
     write_csv_report(path, [{"z": 2, "a": 1}])
     assert path.read_text(encoding="utf-8").splitlines()[0] == "a,z"
+
+
+@pytest.mark.unit
+def test_encode_json_compact_is_sorted_utf8_bytes() -> None:
+    encoded = encode_json({"b": "é", "a": [1, 2]}, indent=False)
+    assert encoded == '{"a":[1,2],"b":"é"}'.encode("utf-8")
+
+
+@pytest.mark.unit
+def test_write_csv_stream_streams_rows_with_explicit_fieldnames() -> None:
+    buffer = io.StringIO(newline="")
+    rows = ({"b": idx, "a": -idx} for idx in range(3))
+    write_csv_stream(buffer, rows, fieldnames=("b", "a"))
+    assert buffer.getvalue().splitlines() == ["b,a", "0,0", "1,-1", "2,-2"]
+
+
+@pytest.mark.unit
+def test_write_csv_stream_requires_fieldnames_for_iterators() -> None:
+    buffer = io.StringIO(newline="")
+    rows = iter([{"a": 1}, {"a": 2, "b": 3}])
+    with pytest.raises(ValueError, match="fieldnames is required"):
+        write_csv_stream(buffer, rows)
+    assert buffer.getvalue() == ""
+    assert next(rows) == {"a": 1}
+
+
+@pytest.mark.unit
+def test_write_csv_stream_appends_late_keys_in_first_seen_order() -> None:
+    buffer = io.StringIO(newline="")
+    write_csv_stream(buffer, [{"z": 1, "a": 2}, {"a": 3, "m": 4}, {"b": 5}])
+    assert buffer.getvalue().splitlines() == ["a,z,m,b", "2,1,,", "3,,4,", ",,,5"]
+
+
+@pytest.mark.unit
+def test_write_json_report_replaces_existing_file_without_leftovers(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "r.json"
+    write_json_report(path, {"a": 1})
+    write_json_report(path, {"a": 2})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 2}
+    assert sorted(p.name for p in path.parent.iterdir()) == ["r.json"]
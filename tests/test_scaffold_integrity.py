@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -10,15 +11,10 @@ ROOT = Path(__file__).resolve().parents[1]
 
 
 @pytest.mark.unit
-def test_schema_files_exist_and_parse() -> None:
-    schema_paths = [
-        ROOT / "schemas" / "config_v1.schema.json",
-        ROOT / "schemas" / "flash_report_v1.schema.json",
-        ROOT / "schemas" / "test_report_v1.schema.json",
-    ]
-    for path in schema_paths:
-        assert path.exists(), f"Missing schema file: {path}"
-        payload = json.loads(path.read_text(encoding="utf-8"))
+def test_schema_files_exist_and_parse(parsed_schemas: dict[str, Any]) -> None:
+    for name in ("config_v1.schema.json", "flash_report_v1.schema.json", "test_report_v1.schema.json"):
+        assert name in parsed_schemas, f"Missing schema file: {ROOT / 'schemas' / name}"
+        payload = parsed_schemas[name]
         assert payload["$schema"].startswith("https://json-schema.org/")
         assert "required" in payload
 
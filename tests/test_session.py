@@ -24,9 +24,13 @@ class FakeTransport:
         return {"max_current": 45}
 
 
+@pytest.fixture
+def transport() -> FakeTransport:
+    return FakeTransport()
+
+
 @pytest.mark.unit
-def test_connect_and_get_firmware() -> None:
-    transport = FakeTransport()
+def test_connect_and_get_firmware(transport: FakeTransport) -> None:
     session = RoboClawSession(transport=transport, address=0x80)
 
     session.connect("/dev/ttyACM0")
@@ -39,14 +43,14 @@ def test_connect_and_get_firmware() -> None:
 
 
 @pytest.mark.unit
-def test_get_firmware_requires_connection() -> None:
-    session = RoboClawSession(transport=FakeTransport())
+def test_get_firmware_requires_connection(transport: FakeTransport) -> None:
+    session = RoboClawSession(transport=transport)
     with pytest.raises(NoResponseError, match="not connected"):
         session.get_firmware()
 
 
 @pytest.mark.unit
-def test_dump_config_requires_connection() -> None:
-    session = RoboClawSession(transport=FakeTransport())
+def test_dump_config_requires_connection(transport: FakeTransport) -> None:
+    session = RoboClawSession(transport=transport)
     with pytest.raises(NoResponseError, match="not connected"):
         session.dump_config()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from motion_studio_linux.errors import ModeMismatchError
-from motion_studio_linux.recipes import Recipe, RecipeStep
+from motion_studio_linux.recipes import Recipe, RecipeStep, resolve_recipe
 from motion_studio_linux.telemetry import Telemetry
 from motion_studio_linux.tester import Tester as RecipeTester
 
@@ -27,15 +27,20 @@ class FakeSession:
         return {field: idx for idx, field in enumerate(fields, start=1)}
 
 
+@pytest.fixture
+def session() -> FakeSession:
+    return FakeSession()
+
+
 @pytest.mark.unit
-def test_run_recipe_mode_gating_raises_and_stops() -> None:
+def test_run_recipe_mode_gating_raises_and_stops(session: FakeSession) -> None:
     recipe = Recipe(
         recipe_id="smoke_v1",
         safety_limits={"max_duty": 20, "max_runtime_s": 2},
         telemetry_fields=("battery_voltage",),
         steps=(RecipeStep(channel=1, duty=10, duration_s=0.2),),
     )
-    session = FakeSession(motion_enabled=False)
+    session.motion_enabled = False
     telemetry = Telemetry(session)  # type: ignore[arg-type]
     tester = RecipeTester(session, telemetry)  # type: ignore[arg-type]
 
@@ -45,14 +50,13 @@ def test_run_recipe_mode_gating_raises_and_stops() -> None:
 
 
 @pytest.mark.unit
-def test_run_recipe_safety_abort_returns_failed_report_and_stops() -> None:
+def test_run_recipe_safety_abort_returns_failed_report_and_stops(session: FakeSession) -> None:
     recipe = Recipe(
         recipe_id="smoke_v1",
         safety_limits={"max_duty": 20, "max_runtime_s": 2},
         telemetry_fields=("battery_voltage",),
         steps=(RecipeStep(channel=1, duty=25, duration_s=0.2),),
     )
-    session = FakeSession(motion_enabled=True)
     telemetry = Telemetry(session)  # type: ignore[arg-type]
     tester = RecipeTester(session, telemetry)  # type: ignore[arg-type]
 
@@ -61,3 +65,20 @@ def test_run_recipe_safety_abort_returns_failed_report_and_stops() -> None:
     assert report.reason == "safety_abort"
     assert report.abort_reason == "Duty exceeds safety limit."
     assert session.stop_calls == 1
+
+
+@pytest.mark.unit
+def test_resolve_recipe_returns_shared_read_only_builtin() -> None:
+    recipe = resolve_recipe("smoke_v1")
+    assert resolve_recipe("smoke_v1") is recipe
+    with pytest.raises(TypeError):
+        recipe.safety_limits["max_duty"] = 100  # type: ignore[index]
+    with pytest.raises(ValueError, match="Unsupported recipe"):
+        resolve_recipe("missing")
+
+
+@pytest.mark.unit
+def test_poll_fields_handles_empty_and_populated_field_tuples(session: FakeSession) -> None:
+    telemetry = Telemetry(session)  # type: ignore[arg-type]
+    assert telemetry.poll_fields(()).fields == {}
+    assert telemetry.poll_fields(("battery_voltage", "encoder1")).fields == {"battery_voltage": 1, "encoder1": 2}